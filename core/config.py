@@ -1,19 +1,34 @@
 import os
+import sys
+import functools
 from dotenv import load_dotenv
+from eth_utils import to_checksum_address
 load_dotenv()
 
+# Snapshot the environment once; every config read below is a plain dict lookup
+_ENV = dict(os.environ)
+
+def _env(key, default=None):
+    """Read a value from the import-time environment snapshot."""
+    return _ENV.get(key, default)
+
 # V3 Vault is deterministic (Same addr on all chains)
 BALANCER_V3_VAULT = "0xbA1333333333a1BA1108E8412f11850A5C319bA9"
 
+# Multicall3 is deployed at the same address on every supported chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
 # Note: Address 0x0000000000000000000000000000000000000000 (zero address) indicates
 # that a protocol/router is not available or not deployed on that specific chain.
-# The system should check for zero addresses before attempting to interact with these protocols.
+# These placeholders are resolved at load time: CHAINS fields become None and
+# DEX_ROUTERS entries are dropped, so callers only need an `if address:` check.
+ZERO_ADDRESS = sys.intern("0x" + "0" * 40)
 
 CHAINS = {
     1: {  # Ethereum Mainnet
         "name": "ethereum",
-        "rpc": os.getenv("RPC_ETHEREUM"),
-        "wss": os.getenv("WSS_ETHEREUM"),
+        "rpc": _env("RPC_ETHEREUM"),
+        "wss": _env("WSS_ETHEREUM"),
         "aave_pool": "0x87870Bca3F3fD6335C3F4ce8392D69350B4fA4E2",
         "uniswap_router": "0xE592427A0AEce92De3Edee1F18E0157C05861564",
         "curve_router": "0x99a58482BD75cbab83b27EC03CA68fF489b5788f",
@@ -21,8 +36,8 @@ CHAINS = {
     },
     137: {
         "name": "polygon",
-        "rpc": os.getenv("RPC_POLYGON"),
-        "wss": os.getenv("WSS_POLYGON"),
+        "rpc": _env("RPC_POLYGON"),
+        "wss": _env("WSS_POLYGON"),
         "aave_pool": "0x794a61358D6845594F94dc1DB02A252b5b4814aD",
         "uniswap_router": "0xE592427A0AEce92De3Edee1F18E0157C05861564",
         "curve_router": "0x445FE580eF8d70FF569aB36e80c647af338db351",  # Curve aave pool on Polygon
@@ -30,8 +45,8 @@ CHAINS = {
     },
     42161: {
         "name": "arbitrum",
-        "rpc": os.getenv("RPC_ARBITRUM"),
-        "wss": os.getenv("WSS_ARBITRUM"),
+        "rpc": _env("RPC_ARBITRUM"),
+        "wss": _env("WSS_ARBITRUM"),
         "aave_pool": "0x794a61358D6845594F94dc1DB02A252b5b4814aD",
         "uniswap_router": "0xE592427A0AEce92De3Edee1F18E0157C05861564",
         "curve_router": "0x0000000000000000000000000000000000000000",  # Curve not deployed on Arbitrum
@@ -39,8 +54,8 @@ CHAINS = {
     },
     10: {
         "name": "optimism",
-        "rpc": os.getenv("RPC_OPTIMISM"),
-        "wss": os.getenv("WSS_OPTIMISM"),
+        "rpc": _env("RPC_OPTIMISM"),
+        "wss": _env("WSS_OPTIMISM"),
         "aave_pool": "0x794a61358D6845594F94dc1DB02A252b5b4814aD",
         "uniswap_router": "0xE592427A0AEce92De3Edee1F18E0157C05861564",
         "curve_router": "0x0000000000000000000000000000000000000000",  # Curve not deployed on Optimism
@@ -48,8 +63,8 @@ CHAINS = {
     },
     8453: {
         "name": "base",
-        "rpc": os.getenv("RPC_BASE"),
-        "wss": os.getenv("WSS_BASE"),
+        "rpc": _env("RPC_BASE"),
+        "wss": _env("WSS_BASE"),
         "aave_pool": "0x0000000000000000000000000000000000000000",  # Aave not available on Base
         "uniswap_router": "0x2626664c2603336E57B271c5C0b26F421741e481",
         "curve_router": "0x0000000000000000000000000000000000000000",  # Curve not deployed on Base
@@ -57,8 +72,8 @@ CHAINS = {
     },
     56: {
         "name": "bsc",
-        "rpc": os.getenv("RPC_BSC"),
-        "wss": os.getenv("WSS_BSC"),
+        "rpc": _env("RPC_BSC"),
+        "wss": _env("WSS_BSC"),
         "aave_pool": "0x0000000000000000000000000000000000000000",  # Aave not available on BSC
         "uniswap_router": "0x0000000000000000000000000000000000000000",  # Uniswap not deployed on BSC (use PancakeSwap)
         "pancake_router": "0x13f4EA83D0bd40E75C8222255bc855a974568Dd4",
@@ -66,8 +81,8 @@ CHAINS = {
     },
     43114: {
         "name": "avalanche",
-        "rpc": os.getenv("RPC_AVALANCHE"),
-        "wss": os.getenv("WSS_AVALANCHE"),
+        "rpc": _env("RPC_AVALANCHE"),
+        "wss": _env("WSS_AVALANCHE"),
         "aave_pool": "0x794a61358D6845594F94dc1DB02A252b5b4814aD",
         "uniswap_router": "0x0000000000000000000000000000000000000000",  # Uniswap not deployed on Avalanche (use TraderJoe)
         "traderjoe_router": "0x60aE616a2155Ee3d9A68541Ba4544862310933d4",
@@ -75,7 +90,7 @@ CHAINS = {
     },
     250: {
         "name": "fantom",
-        "rpc": os.getenv("RPC_FANTOM"),
+        "rpc": _env("RPC_FANTOM"),
         "wss": None,
         "aave_pool": "0x0000000000000000000000000000000000000000",  # Aave not available on Fantom
         "uniswap_router": "0x0000000000000000000000000000000000000000",  # Uniswap not deployed on Fantom (use SpookySwap)
@@ -84,8 +99,8 @@ CHAINS = {
     },
     59144: {
         "name": "linea",
-        "rpc": os.getenv("RPC_LINEA"),
-        "wss": os.getenv("WSS_LINEA"),
+        "rpc": _env("RPC_LINEA"),
+        "wss": _env("WSS_LINEA"),
         "aave_pool": "0x0000000000000000000000000000000000000000",  # Aave not available on Linea
         "uniswap_router": "0x0000000000000000000000000000000000000000",  # Uniswap not deployed on Linea
         "syncswap_router": "0x0000000000000000000000000000000000000000",  # SyncSwap not configured for Linea
@@ -93,24 +108,24 @@ CHAINS = {
     },
     534352: {
         "name": "scroll",
-        "rpc": os.getenv("RPC_SCROLL"),
-        "wss": os.getenv("WSS_SCROLL"),
+        "rpc": _env("RPC_SCROLL"),
+        "wss": _env("WSS_SCROLL"),
         "aave_pool": "0x0000000000000000000000000000000000000000",  # Aave not available on Scroll
         "uniswap_router": "0x0000000000000000000000000000000000000000",  # Uniswap not deployed on Scroll
         "native": "ETH"
     },
     5000: {
         "name": "mantle",
-        "rpc": os.getenv("RPC_MANTLE"),
-        "wss": os.getenv("WSS_MANTLE"),
+        "rpc": _env("RPC_MANTLE"),
+        "wss": _env("WSS_MANTLE"),
         "aave_pool": "0x0000000000000000000000000000000000000000",  # Aave not available on Mantle
         "uniswap_router": "0x0000000000000000000000000000000000000000",  # Uniswap not deployed on Mantle
         "native": "MNT"
     },
     324: {
         "name": "zksync",
-        "rpc": os.getenv("RPC_ZKSYNC"),
-        "wss": os.getenv("WSS_ZKSYNC"),
+        "rpc": _env("RPC_ZKSYNC"),
+        "wss": _env("WSS_ZKSYNC"),
         "aave_pool": "0x0000000000000000000000000000000000000000",  # Aave not available on zkSync
         "uniswap_router": "0x0000000000000000000000000000000000000000",  # Uniswap not deployed on zkSync (use SyncSwap)
         "syncswap_router": "0x2da10A1e27bF85cEdD8FFb1AbBe97e53391C0295",
@@ -118,8 +133,8 @@ CHAINS = {
     },
     81457: {
         "name": "blast",
-        "rpc": os.getenv("RPC_BLAST"),
-        "wss": os.getenv("WSS_BLAST"),
+        "rpc": _env("RPC_BLAST"),
+        "wss": _env("WSS_BLAST"),
         "aave_pool": "0x0000000000000000000000000000000000000000",  # Aave not available on Blast
         "uniswap_router": "0x0000000000000000000000000000000000000000",  # Uniswap not deployed on Blast
         "thruster_router": "0x0000000000000000000000000000000000000000",  # Thruster not configured for Blast
@@ -127,7 +142,7 @@ CHAINS = {
     },
     42220: {
         "name": "celo",
-        "rpc": os.getenv("RPC_CELO"),
+        "rpc": _env("RPC_CELO"),
         "wss": None,
         "aave_pool": "0x0000000000000000000000000000000000000000",  # Aave not available on Celo
         "uniswap_router": "0x0000000000000000000000000000000000000000",  # Uniswap not deployed on Celo (use Ubeswap)
@@ -136,8 +151,8 @@ CHAINS = {
     },
     204: {
         "name": "opbnb",
-        "rpc": os.getenv("RPC_OPBNB"),
-        "wss": os.getenv("WSS_OPBNB"),
+        "rpc": _env("RPC_OPBNB"),
+        "wss": _env("WSS_OPBNB"),
         "aave_pool": "0x0000000000000000000000000000000000000000",  # Aave not available on opBNB
         "uniswap_router": "0x0000000000000000000000000000000000000000",  # Uniswap not deployed on opBNB
         "pancake_router": "0x0000000000000000000000000000000000000000",  # PancakeSwap not configured for opBNB
@@ -146,6 +161,41 @@ CHAINS = {
     # Add remaining 8 chains here following the pattern
 }
 
+# Chains with an RPC endpoint configured (CHAINS is fixed after import, so compute once)
+CONFIGURED_CHAINS = tuple(cid for cid, cfg in CHAINS.items() if cfg.get("rpc"))
+CONFIGURED_CHAIN_SET = frozenset(CONFIGURED_CHAINS)
+
+# Flat per-field views of CHAINS for hot-path reads (one dict probe, no {} default)
+CHAIN_NAMES = {cid: cfg["name"] for cid, cfg in CHAINS.items()}
+RPC_URLS = {cid: cfg.get("rpc") for cid, cfg in CHAINS.items()}
+WSS_URLS = {cid: cfg.get("wss") for cid, cfg in CHAINS.items()}
+NATIVE_TOKENS = {cid: cfg.get("native") for cid, cfg in CHAINS.items()}
+
+def _rpc_endpoints(cfg):
+    """Primary RPC plus any comma-separated RPC_<NAME>_FALLBACKS, placeholders dropped."""
+    fallbacks = _env(f"RPC_{cfg['name'].upper()}_FALLBACKS", "")
+    urls = [cfg.get("rpc")] + [url.strip() for url in fallbacks.split(",")]
+    return tuple(dict.fromkeys(url for url in urls if url and 'YOUR_' not in url.upper()))
+
+# Every usable endpoint per chain, primary first (for failover providers)
+RPC_ENDPOINTS = {cid: _rpc_endpoints(cfg) for cid, cfg in CHAINS.items()}
+
+@functools.lru_cache(maxsize=128)
+def _unknown_chain_label(chain_id):
+    return f"Chain {chain_id}"
+
+def get_chain_name(chain_id):
+    """
+    Get the configured name for a chain, or a stable label for unknown IDs.
+    
+    Args:
+        chain_id (int): Chain ID
+        
+    Returns:
+        str: Chain name (e.g. "polygon") or "Chain <id>"
+    """
+    return CHAIN_NAMES.get(chain_id) or _unknown_chain_label(chain_id)
+
 # DEX Router Registry - Maps chain IDs to DEX names and their router contract addresses
 DEX_ROUTERS = {
     1: {  # Ethereum
@@ -181,6 +231,89 @@ DEX_ROUTERS = {
     }
 }
 
+# Uniswap V3 QuoterV2 per chain (official deployments; chains not listed have none)
+UNISWAP_V3_QUOTER_V2 = {
+    1: "0x61fFE014bA17989E743c5F6cB21bF9697530B21e",  # Ethereum
+    137: "0x61fFE014bA17989E743c5F6cB21bF9697530B21e",  # Polygon
+    42161: "0x61fFE014bA17989E743c5F6cB21bF9697530B21e",  # Arbitrum
+    10: "0x61fFE014bA17989E743c5F6cB21bF9697530B21e",  # Optimism
+    8453: "0x3d4e44Eb1374240CE5F1B871ab261CD16335B76a",  # Base
+    56: "0x78D78E420Da98ad378D7799bE8f4AF69033EB077",  # BSC
+    43114: "0xbe0F5544EC67e9B3b2D979aaA43f18Fd87E6257F",  # Avalanche
+    42220: "0x82825d0554fA07f7FC52Ab63c961F330fdEFa8E8",  # Celo
+    81457: "0x6Cdcd65e03c1CEc3730AeeCd45bc140D57A25C77",  # Blast
+}
+
+def _canonical_address(address):
+    """EIP-55 checksum and intern an address; zero-address placeholders become None."""
+    if not address or address == ZERO_ADDRESS:
+        return None
+    return sys.intern(to_checksum_address(address))
+
+# Normalize every contract address once at load; downstream code can pass them
+# straight to web3 and compare them without re-hashing or re-lowercasing
+for _cfg in CHAINS.values():
+    for _key, _value in _cfg.items():
+        if _key.endswith(("_pool", "_router")):
+            _cfg[_key] = _canonical_address(_value)
+
+for _cid, _routers in list(DEX_ROUTERS.items()):
+    for _dex, _addr in list(_routers.items()):
+        _addr = _canonical_address(_addr)
+        if _addr:
+            _routers[_dex] = _addr
+        else:
+            del _routers[_dex]
+    if not _routers:
+        del DEX_ROUTERS[_cid]
+
+UNISWAP_V3_QUOTER_V2 = {cid: _canonical_address(addr) for cid, addr in UNISWAP_V3_QUOTER_V2.items()}
+
+BALANCER_V3_VAULT = _canonical_address(BALANCER_V3_VAULT)
+MULTICALL3_ADDRESS = _canonical_address(MULTICALL3_ADDRESS)
+
+# Memoized lookups; CHAINS and DEX_ROUTERS are fixed once the module has loaded.
+# Call <helper>.cache_clear() if either is ever mutated at runtime.
+@functools.lru_cache(maxsize=None)
+def get_chain_config(chain_id):
+    """
+    Get the CHAINS entry for a chain.
+    
+    Args:
+        chain_id (int): Chain ID
+        
+    Returns:
+        dict: Chain config, or None if the chain is not configured
+    """
+    return CHAINS.get(chain_id)
+
+@functools.lru_cache(maxsize=None)
+def get_router(protocol_name, chain_id):
+    """
+    Get a DEX router address on a chain.
+    
+    Args:
+        protocol_name (str): DEX_ROUTERS key (e.g. "SUSHI", "QUICKSWAP")
+        chain_id (int): Chain ID
+        
+    Returns:
+        str: Checksummed router address, or None if not deployed there
+    """
+    routers = DEX_ROUTERS.get(chain_id)
+    return routers.get(protocol_name) if routers else None
+
+def get_native_token(chain_id):
+    """
+    Get the native gas token symbol for a chain.
+    
+    Args:
+        chain_id (int): Chain ID
+        
+    Returns:
+        str: Symbol (e.g. "ETH", "MATIC"), or None if the chain is not configured
+    """
+    return NATIVE_TOKENS.get(chain_id)
+
 # ======================================================================
 # LIFI BRIDGE CONFIGURATION - Intent-Based Cross-Chain Bridging
 # ======================================================================
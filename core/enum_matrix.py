@@ -1,9 +1,31 @@
 """
 Enum Matrix - Chain ID enumeration and provider management utilities
 """
+import re
+import threading
 from enum import IntEnum
-from web3 import Web3
-from core.config import CHAINS
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from core.config import CONFIGURED_CHAINS, RPC_URLS
+
+# http(s) endpoint with a host; local nodes (anvil/hardhat forks) are allowed
+_VALID_RPC_RE = re.compile(r"^https?://[^/\s]+", re.IGNORECASE)
+_PLACEHOLDER_RE = re.compile(r"YOUR_", re.IGNORECASE)
+
+# Raw JSON-RPC health probe; avoids web3 middleware/decoding for a block height
+_BLOCK_NUMBER_PAYLOAD = {"jsonrpc": "2.0", "method": "eth_blockNumber", "params": [], "id": 1}
+
+# web3 pulls in eth_abi/eth_account/rlp; only import it once a provider is needed
+_Web3 = None
+
+def _get_web3():
+    """Import web3 on first use and return the Web3 class."""
+    global _Web3
+    if _Web3 is None:
+        from web3 import Web3
+        _Web3 = Web3
+    return _Web3
 
 class ChainID(IntEnum):
     """
@@ -32,27 +54,77 @@ class ProviderManager:
     Manages Web3 provider connections for multiple chains
     """
     
-    @staticmethod
-    def get_provider(chain_id):
+    # Validated RPC URL per chain, pinned once at import (see bottom of module)
+    _rpc_urls = {}
+    
+    # One keep-alive session shared by every provider, one Web3 per chain
+    _session = None
+    _w3_by_chain = {}
+    _lock = threading.Lock()
+    
+    @classmethod
+    def _get_session(cls):
+        """Lazily build the shared pooled HTTP session."""
+        if cls._session is None:
+            with cls._lock:
+                if cls._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    cls._session = session
+        return cls._session
+    
+    @classmethod
+    def get_rpc_url(cls, chain_id):
+        """
+        Get the validated RPC URL for a chain.
+        
+        Args:
+            chain_id (int): Chain ID
+            
+        Returns:
+            str: RPC URL or None if not configured
+        """
+        return cls._rpc_urls.get(chain_id)
+    
+    @classmethod
+    def invalidate_rpc_cache(cls, chain_id=None):
+        """
+        Drop cached Web3 clients so the next get_provider() reconnects.
+        
+        Args:
+            chain_id (int): Chain to invalidate, or None for all chains
+        """
+        if chain_id is None:
+            cls._w3_by_chain.clear()
+        else:
+            cls._w3_by_chain.pop(chain_id, None)
+    
+    @classmethod
+    def get_provider(cls, chain_id):
         """
         Get Web3 provider for a specific chain
         
+        The Web3 instance is built once per chain on top of the shared session,
+        so repeated calls reuse warm connections instead of a new handshake.
+        
         Args:
             chain_id (int): Chain ID
             
         Returns:
             Web3: Connected Web3 instance or None if not configured
         """
-        chain_config = CHAINS.get(chain_id)
-        if not chain_config or not chain_config.get('rpc'):
-            return None
-        
-        rpc_url = chain_config['rpc']
+        rpc_url = cls.get_rpc_url(chain_id)
         if not rpc_url:
             return None
         
         try:
-            w3 = Web3(Web3.HTTPProvider(rpc_url))
+            w3 = cls._w3_by_chain.get(chain_id)
+            if w3 is None:
+                Web3 = _get_web3()
+                w3 = Web3(Web3.HTTPProvider(rpc_url, session=cls._get_session()))
+                cls._w3_by_chain[chain_id] = w3
             if w3.is_connected():
                 return w3
         except Exception as e:
@@ -68,33 +140,79 @@ class ProviderManager:
         Returns:
             dict: {chain_id: Web3 instance}
         """
-        providers = {}
-        for chain_id in CHAINS.keys():
-            provider = ProviderManager.get_provider(chain_id)
-            if provider:
-                providers[chain_id] = provider
+        chain_ids = CONFIGURED_CHAINS
+        if not chain_ids:
+            return {}
+        
+        # Probe all chains concurrently - each probe blocks on an RPC round-trip,
+        # so wall time is bounded by the slowest endpoint instead of the sum
+        with ThreadPoolExecutor(max_workers=len(chain_ids)) as pool:
+            results = pool.map(ProviderManager.get_provider, chain_ids)
+            providers = {
+                chain_id: provider
+                for chain_id, provider in zip(chain_ids, results)
+                if provider
+            }
         
         return providers
     
-    @staticmethod
-    def test_connection(chain_id):
+    @classmethod
+    def test_connection(cls, chain_id):
         """
         Test connection to a specific chain
         
+        Sends a bare eth_blockNumber over the shared session instead of going
+        through web3.
+        
         Args:
             chain_id (int): Chain ID to test
             
         Returns:
             bool: True if connected, False otherwise
         """
-        provider = ProviderManager.get_provider(chain_id)
-        if not provider:
+        rpc_url = cls.get_rpc_url(chain_id)
+        if not rpc_url:
             return False
         
         try:
-            block_number = provider.eth.block_number
+            resp = cls._get_session().post(rpc_url, json=_BLOCK_NUMBER_PAYLOAD, timeout=3)
+            # Require 2xx and a JSON-RPC result; error payloads don't count as connected
+            if resp.status_code // 100 != 2:
+                raise RuntimeError(f"HTTP {resp.status_code}")
+            body = resp.json()
+            if "result" not in body:
+                raise RuntimeError(body.get("error", "missing result"))
+            block_number = int(body["result"], 16)
             print(f"✅ Chain {chain_id}: Connected | Block: {block_number}")
             return True
         except Exception as e:
             print(f"❌ Chain {chain_id}: Connection failed | Error: {e}")
             return False
+
+
+def _validate_rpc_url(chain_id, rpc_url):
+    """
+    Validate one configured RPC URL.
+    
+    Unfilled .env template values (``YOUR_...``) and non-http(s) values count
+    as not configured.
+    
+    Args:
+        chain_id (int): Chain ID
+        rpc_url (str): URL from the environment
+        
+    Returns:
+        str: The URL, or None if the chain is not configured
+    """
+    if not rpc_url or _PLACEHOLDER_RE.search(rpc_url):
+        return None
+    if not _VALID_RPC_RE.match(rpc_url):
+        print(f"⚠️ Ignoring non-HTTP RPC URL for chain {chain_id}")
+        return None
+    return rpc_url
+
+
+# Validate once at import so get_rpc_url is a plain dict lookup
+ProviderManager._rpc_urls = {
+    cid: _validate_rpc_url(cid, RPC_URLS.get(cid)) for cid in CONFIGURED_CHAINS
+}
@@ -0,0 +1,40 @@
+import threading
+from concurrent.futures import Future
+
+# Single-flight registry: identical RPC reads requested concurrently (e.g. the
+# same quote or TVL probe from several scan threads) share one call instead of N.
+# Keys are tagged tuples ("univ3", ...), ("tvl", ...) so callers never collide.
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+def single_flight(key, fetch):
+    """
+    Run fetch() once per key at a time; concurrent callers wait for that result.
+    
+    Args:
+        key: Hashable identity of the request
+        fetch: Zero-argument callable performing the request
+        
+    Returns:
+        The value returned by fetch()
+    """
+    with _inflight_lock:
+        future = _inflight.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = Future()
+            _inflight[key] = future
+    
+    if not is_leader:
+        return future.result()
+    
+    try:
+        result = fetch()
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
@@ -1,8 +1,18 @@
 import json
 import os
+import time
+import threading
+from collections import Counter, namedtuple
+from functools import lru_cache
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
+from web3.providers import JSONBaseProvider
+from eth_abi import encode, decode
 from dotenv import load_dotenv
-from core.config import CHAINS, BALANCER_V3_VAULT
+from core.config import CHAINS, RPC_ENDPOINTS, BALANCER_V3_VAULT, UNISWAP_V3_QUOTER_V2
+from core.single_flight import single_flight
 
 load_dotenv()
 
@@ -12,6 +22,230 @@ ERC20_ABI = [{"constant":True,"inputs":[{"name":"_owner","type":"address"}],"nam
 # Uniswap V3 Quoter V2 ABI (Minimal)
 QUOTER_ABI = [{"inputs":[{"components":[{"internalType":"address","name":"tokenIn","type":"address"},{"internalType":"address","name":"tokenOut","type":"address"},{"internalType":"uint256","name":"amountIn","type":"uint256"},{"internalType":"uint24","name":"fee","type":"uint24"},{"internalType":"uint160","name":"sqrtPriceLimitX96","type":"uint160"}],"internalType":"struct IQuoterV2.QuoteExactInputSingleParams","name":"params","type":"tuple"}],"name":"quoteExactInputSingle","outputs":[{"internalType":"uint256","name":"amountOut","type":"uint256"},{"internalType":"uint160","name":"sqrtPriceX96After","type":"uint160"},{"internalType":"uint32","name":"initializedTicksCrossed","type":"uint32"},{"internalType":"uint256","name":"gasEstimate","type":"uint256"}],"stateMutability":"nonpayable","type":"function"}]
 
+# An ABI function resolved once at import: selector plus calldata encoder and
+# returndata decoder, so calls never walk the ABI dicts or build a contract
+AbiFunction = namedtuple("AbiFunction", ["selector", "encode_call", "decode_result"])
+
+
+def _abi_type(param):
+    """Canonical type string for an ABI param, expanding tuple components."""
+    if param["type"].startswith("tuple"):
+        inner = ",".join(_abi_type(c) for c in param["components"])
+        return f"({inner}){param['type'][len('tuple'):]}"
+    return param["type"]
+
+
+def _compile_fn(abi, fn_name):
+    entry = next(e for e in abi if e.get("name") == fn_name)
+    input_types = [_abi_type(p) for p in entry["inputs"]]
+    output_types = [_abi_type(p) for p in entry["outputs"]]
+    selector = bytes(Web3.keccak(text=f"{fn_name}({','.join(input_types)})")[:4])
+
+    def encode_call(*args):
+        return selector + encode(input_types, list(args))
+
+    def decode_result(data):
+        return decode(output_types, data)
+
+    return AbiFunction(selector, encode_call, decode_result)
+
+
+BALANCE_OF = _compile_fn(ERC20_ABI, "balanceOf")
+QUOTE_EXACT_INPUT_SINGLE = _compile_fn(QUOTER_ABI, "quoteExactInputSingle")
+
+
+@lru_cache(maxsize=256)
+def _balance_of_calldata(owner):
+    """balanceOf(owner) calldata is the same for every token; only a handful of lenders exist."""
+    return BALANCE_OF.encode_call(owner)
+
+
+# Lightweight counters so RPC-count regressions show up in tests and logs:
+# RPC_CALLS[(method, chain_id)] and METRICS["tvl_cache_hits" | "tvl_cache_misses" | "engine_constructions"]
+RPC_CALLS = Counter()
+METRICS = Counter()
+
+
+def _counted(make_request, chain_id):
+    """Wrap a provider's make_request to count RPCs per (method, chain)."""
+    def make_counted_request(method, params):
+        RPC_CALLS[(method, chain_id)] += 1
+        return make_request(method, params)
+    return make_counted_request
+
+
+def metrics_snapshot():
+    """
+    Current simulation engine counters.
+    
+    Returns:
+        dict: {"rpc_calls": {(method, chain_id): count}, <metric>: count, ...}
+    """
+    return {"rpc_calls": dict(RPC_CALLS), **METRICS}
+
+
+def reset_metrics():
+    RPC_CALLS.clear()
+    METRICS.clear()
+
+# Lender balances move slowly relative to how often routes re-check them, so
+# successful reads are reused for a short window: {(chain, token, lender): (balance, expires_at)}
+_TVL_CACHE = {}
+_TVL_TTL = 15.0
+# An empty vault rarely gets funded between scans; remember "no liquidity" for
+# much longer so unsupported tokens stop costing an RPC call every check
+_EMPTY_TVL_TTL = 300.0
+
+
+@lru_cache(maxsize=4096)
+def _checksum(address):
+    """
+    EIP-55 form of an address, memoised: callers pass the same few hundred
+    tokens over and over. Raises ValueError for a malformed address.
+    """
+    return Web3.to_checksum_address(address)
+
+
+def _tvl_key(chain_id, token_address, lender_address):
+    # Lender addresses come from core.config, which already checksums them
+    return (chain_id, _checksum(token_address), lender_address)
+
+
+def _cached_tvl(key):
+    entry = _TVL_CACHE.get(key)
+    if entry and entry[1] > time.monotonic():
+        METRICS["tvl_cache_hits"] += 1
+        return entry[0]
+    METRICS["tvl_cache_misses"] += 1
+    return None
+
+
+def _store_tvl(key, balance, now):
+    _TVL_CACHE[key] = (balance, now + (_TVL_TTL if balance else _EMPTY_TVL_TTL))
+
+
+def invalidate_tvl_cache(chain_id=None):
+    """Drop cached TVL readings for one chain, or for every chain."""
+    if chain_id is None:
+        _TVL_CACHE.clear()
+        return
+    for key in [k for k in _TVL_CACHE if k[0] == chain_id]:
+        _TVL_CACHE.pop(key, None)
+
+
+# Per-request RPC timeout; a hung endpoint costs at most this long per attempt
+RPC_TIMEOUT_SECONDS = 5
+
+# Single endpoint only: rate limits and gateway errors are retried in place (every
+# call here is a read-only eth_call, so retrying POSTs is safe). Read timeouts
+# are never retried and connects only once, so a dead node fails after about
+# one timeout instead of stalling every coalesced caller.
+_SINGLE_ENDPOINT_RETRY = Retry(
+    total=3,
+    connect=1,
+    read=0,
+    backoff_factor=0.1,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=frozenset({"POST"}),
+)
+
+
+def _rpc_session(max_retries):
+    """Keep-alive pool so repeated TVL/quote reads reuse one TLS connection."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=max_retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Endpoints that time out or rate-limit are skipped for this long
+RPC_COOLDOWN_SECONDS = 30.0
+# Weight of the newest sample in each endpoint's latency average
+RPC_LATENCY_ALPHA = 0.2
+
+
+class FailoverHTTPProvider(JSONBaseProvider):
+    """
+    HTTP provider over several RPC endpoints for one chain.
+    
+    Each request goes to the fastest endpoint that is not cooling down, by
+    moving-average latency. Transport errors (timeouts, 429s, 5xx) put that
+    endpoint on cooldown and the request is retried on the next one. The
+    session passed in should not retry on its own, or a throttled or hung
+    endpoint is hit again before failing over.
+    """
+
+    def __init__(self, endpoint_urls, request_kwargs=None, session=None):
+        super().__init__()
+        self._providers = [
+            Web3.HTTPProvider(
+                url,
+                request_kwargs=request_kwargs,
+                session=session,
+                exception_retry_configuration=None,
+            )
+            for url in endpoint_urls
+        ]
+        self._latency = [0.0] * len(self._providers)
+        self._cooldown_until = [0.0] * len(self._providers)
+        self._lock = threading.Lock()
+
+    def _ordered_endpoints(self):
+        now = time.monotonic()
+        with self._lock:
+            healthy = [i for i, until in enumerate(self._cooldown_until) if until <= now]
+            # All cooling down: still try everything rather than fail outright
+            candidates = healthy or list(range(len(self._providers)))
+            return sorted(candidates, key=self._latency.__getitem__)
+
+    def make_request(self, method, params):
+        last_error = None
+        for i in self._ordered_endpoints():
+            start = time.monotonic()
+            try:
+                response = self._providers[i].make_request(method, params)
+            except requests.RequestException as e:
+                with self._lock:
+                    self._cooldown_until[i] = time.monotonic() + RPC_COOLDOWN_SECONDS
+                last_error = e
+                continue
+            elapsed = time.monotonic() - start
+            with self._lock:
+                self._latency[i] += RPC_LATENCY_ALPHA * (elapsed - self._latency[i])
+            return response
+        raise last_error
+
+    def is_connected(self, show_traceback=False):
+        return any(provider.is_connected() for provider in self._providers)
+
+
+def _build_provider(endpoints):
+    """
+    Provider and its pooled session for a chain's RPC endpoints.
+    
+    Returns:
+        tuple: (provider, requests.Session)
+    """
+    request_kwargs = {'timeout': RPC_TIMEOUT_SECONDS}
+    if len(endpoints) > 1:
+        # Failing over to the next endpoint is the retry, so nothing below it
+        # may retry: one timeout or 429 moves straight on
+        session = _rpc_session(0)
+        provider = FailoverHTTPProvider(endpoints, request_kwargs=request_kwargs, session=session)
+    else:
+        session = _rpc_session(_SINGLE_ENDPOINT_RETRY)
+        # Status retries live in the session adapter; web3's own retry loop
+        # would repeat every timeout five more times on top of it
+        provider = Web3.HTTPProvider(
+            endpoints[0],
+            request_kwargs=request_kwargs,
+            session=session,
+            exception_retry_configuration=None,
+        )
+    return provider, session
+
+
 class TitanSimulationEngine:
     def __init__(self, chain_id):
         self.chain_id = chain_id
@@ -19,33 +253,88 @@ class TitanSimulationEngine:
         
         if not self.chain_config:
             raise ValueError(f"Chain {chain_id} not configured")
+        METRICS["engine_constructions"] += 1
             
         # Initialize Web3 Connection using configured RPC
-        rpc_url = self.chain_config.get('rpc')
-        if not rpc_url:
+        self._session = None
+        endpoints = RPC_ENDPOINTS.get(chain_id, ())
+        if not endpoints:
             self.w3 = None
             return
             
         try:
-            self.w3 = Web3(Web3.HTTPProvider(
-                rpc_url,
-                request_kwargs={'timeout': 10}
-            ))
+            provider, self._session = _build_provider(endpoints)
+            provider.make_request = _counted(provider.make_request, chain_id)
+            self.w3 = Web3(provider)
             if not self.w3.is_connected():
                 self.w3 = None
+                self.close()
         except Exception as e:
             self.w3 = None
+            self.close()
+
+    def close(self):
+        """Release the pooled HTTP connections."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
 
     def get_lender_tvl(self, token_address, protocol="BALANCER"):
         """
         Checks how deep the lender's pockets are.
         Returns: Total Available Liquidity (int, raw units)
         """
-        # Skip TVL checks if Web3 not connected (PAPER mode)
-        if not self.w3 or not self.w3.is_connected():
+        # Skip TVL checks if Web3 not connected (PAPER mode).
+        # Connectivity is probed once in __init__; a dropped connection
+        # surfaces as a failed call below and is handled there.
+        if not self.w3:
             return 0
             
-        # Determine Lender Address
+        lender_address = self._lender_address(protocol)
+        if not lender_address:
+            return 0
+
+        try:
+            key = _tvl_key(self.chain_id, token_address, lender_address)
+        except ValueError:
+            # Not an address at all: nothing to query
+            return 0
+        cached = _cached_tvl(key)
+        if cached is not None:
+            return cached
+
+        # Cache miss: concurrent callers for the same balance share one eth_call
+        return single_flight(("tvl",) + key, lambda: self._read_balance(token_address, lender_address, key))
+
+    def _raw_eth_call(self, to, data):
+        """
+        eth_call straight through the provider, skipping web3's request
+        formatters and middleware. Returns the raw return bytes.
+        Raises ValueError on a JSON-RPC error (e.g. revert).
+        """
+        response = self.w3.provider.make_request(
+            'eth_call', [{'to': to, 'data': "0x" + data.hex()}, 'latest']
+        )
+        if 'error' in response:
+            raise ValueError(response['error'])
+        return bytes.fromhex(response['result'][2:])
+
+    def _read_balance(self, token_address, lender_address, key):
+        # Query Balance (raw eth_call with prebuilt calldata; no contract object)
+        try:
+            raw = self._raw_eth_call(token_address, _balance_of_calldata(lender_address))
+            if not raw:
+                # No code at token_address: nothing to cache
+                return 0
+            balance = BALANCE_OF.decode_result(raw)[0]
+            _store_tvl(key, balance, time.monotonic())
+            return balance
+        except Exception:
+            # Silently return 0 in PAPER mode (vault checks optional)
+            return 0
+
+    def _lender_address(self, protocol):
+        """Resolve the contract whose token balance is the lender's liquidity."""
         lender_address = None
         if protocol == "BALANCER":
             lender_address = BALANCER_V3_VAULT
@@ -55,36 +344,26 @@ class TitanSimulationEngine:
             # the aToken does. But checking the aToken supply is a safe proxy for this V4 implementation.
             # For exact Aave liquidity, we'd query getReserveData, but let's stick to checking the Vault balance for now.
 
-        if not lender_address:
-            return 0
-
-        # Query Balance
-        try:
-            token_contract = self.w3.eth.contract(address=token_address, abi=ERC20_ABI)
-            balance = token_contract.functions.balanceOf(lender_address).call()
-            return balance
-        except Exception:
-            # Silently return 0 in PAPER mode (vault checks optional)
-            return 0
+        return lender_address
 
     def get_price_impact(self, token_in, token_out, amount, fee=500):
         """
         Simulates a swap on Uniswap V3 to calculate output.
         Returns: estimated_output (int)
         """
-        # Address of QuoterV2 (Standard deployment on most chains, check specific chain ID in prod)
-        # Using Arbitrum Quoter as default example
-        quoter_addr = "0x61fFE014bA17989E743c5F6cB21bF9697530B21e" 
+        # No QuoterV2 on this chain: every call would revert, so skip the RPC
+        quoter_addr = UNISWAP_V3_QUOTER_V2.get(self.chain_id)
+        if not quoter_addr or not self.w3:
+            return 0
         
         try:
-            quoter = self.w3.eth.contract(address=quoter_addr, abi=QUOTER_ABI)
-            
             # params: tokenIn, tokenOut, amountIn, fee, sqrtPriceLimitX96
             call_params = (token_in, token_out, int(amount), fee, 0)
+            calldata = QUOTE_EXACT_INPUT_SINGLE.encode_call(call_params)
             
-            # Simulate call (Static Call)
-            quote = quoter.functions.quoteExactInputSingle(call_params).call()
-            amount_out = quote[0]
+            # Simulate call (Static Call); returns (amountOut, sqrtPriceX96After, ticksCrossed, gasEstimate)
+            raw = self._raw_eth_call(quoter_addr, calldata)
+            amount_out = QUOTE_EXACT_INPUT_SINGLE.decode_result(raw)[0]
             
             return amount_out
         except Exception as e:
@@ -92,6 +371,35 @@ class TitanSimulationEngine:
             return 0
 
 
+# Connected engines, one per chain. An engine whose RPC probe failed is never
+# stored, so the next call reconnects instead of staying in PAPER mode for good.
+_ENGINES = {}
+_ENGINES_LOCK = threading.Lock()
+
+
+def _get_engine(chain_id):
+    """Return the shared engine for a chain, rebuilding it until its RPC connects."""
+    engine = _ENGINES.get(chain_id)
+    if engine is not None:
+        return engine
+
+    engine = TitanSimulationEngine(chain_id)
+    if engine.w3 is None:
+        return engine
+    with _ENGINES_LOCK:
+        shared = _ENGINES.setdefault(chain_id, engine)
+    if shared is not engine:
+        # Another thread connected first; keep its engine and drop our session
+        engine.close()
+    return shared
+
+
+def reset_engines():
+    """Drop cached engines so the next call reconnects (e.g. after an RPC change)."""
+    with _ENGINES_LOCK:
+        _ENGINES.clear()
+
+
 # Standalone function for backward compatibility and convenience
 def get_provider_tvl(token_address, lender_address=None, chain_id=137):
     """
@@ -106,5 +414,4 @@ def get_provider_tvl(token_address, lender_address=None, chain_id=137):
     Returns:
         int: Available liquidity in raw token units (smallest token unit)
     """
-    engine = TitanSimulationEngine(chain_id)
-    return engine.get_lender_tvl(token_address, protocol="BALANCER")
\ No newline at end of file
+    return _get_engine(chain_id).get_lender_tvl(token_address, protocol="BALANCER")
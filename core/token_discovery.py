@@ -1,6 +1,65 @@
 """
 Token Discovery Module - Multi-chain token inventory and bridge-compatible asset detection
 """
+import sys
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import lru_cache
+
+from eth_utils import to_checksum_address
+
+# TokenInfo.flags bits
+IS_NATIVE = 1
+IS_WRAPPED_NATIVE = 2
+IS_STABLECOIN = 4
+
+STABLECOIN_SYMBOLS = frozenset({"USDC", "USDT", "DAI", "FRAX"})
+# ERC20 wrapper of each chain's gas token
+WRAPPED_NATIVE_SYMBOLS = {137: "WMATIC", 42161: "WETH", 1: "WETH"}
+
+
+def _address_key(address):
+    """
+    Normalize a hex or raw address to its 20-byte lookup key.
+    
+    bytes.fromhex accepts either case, so checksummed input needs no .lower().
+    
+    Returns:
+        bytes: 20-byte address, or None if the input is empty or not valid hex
+    """
+    if not address:
+        return None
+    if isinstance(address, bytes):
+        return address
+    try:
+        return bytes.fromhex(address[2:] if address[:2] in ("0x", "0X") else address)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def decimal_scale(decimals):
+    """
+    Shared Decimal(10**decimals) for raw <-> human amount conversion.
+    
+    Only a handful of decimals values exist (6, 8, 18), so every token with the
+    same precision reuses one Decimal instance.
+    """
+    return Decimal(10 ** decimals)
+
+
+@dataclass(frozen=True, slots=True)
+class TokenInfo:
+    """Immutable registry entry used by the flat lookup maps."""
+    symbol: str
+    address: str
+    address_lc: str
+    address_bytes: bytes
+    decimals: int
+    scale: int
+    scale_dec: Decimal
+    flags: int = 0
+
 
 class TokenDiscovery:
     """
@@ -8,10 +67,10 @@ class TokenDiscovery:
     """
     
     # Tokens that exist on multiple chains and can be bridged
-    BRIDGE_ASSETS = [
-        "USDC", "USDT", "DAI", "WETH", "WBTC", 
+    BRIDGE_ASSETS = frozenset({
+        "USDC", "USDT", "DAI", "WETH", "WBTC",
         "LINK", "UNI", "AAVE", "MATIC", "FRAX"
-    ]
+    })
     
     # Token addresses by chain - Production ready configuration
     TOKEN_REGISTRY = {
@@ -92,6 +151,13 @@ class TokenDiscovery:
         }
     }
     
+    # Flat views, built after the class below:
+    # {chain_id: {symbol: checksum address}}
+    TOKEN_ADDRESSES = {}
+    # {(chain_id, 20-byte address): TokenInfo} / {(chain_id, symbol): TokenInfo}
+    _BY_ADDRESS = {}
+    _BY_SYMBOL = {}
+    
     @classmethod
     def fetch_all_chains(cls, chain_ids):
         """
@@ -126,11 +192,21 @@ class TokenDiscovery:
         Returns:
             str: Token address or None if not found
         """
-        if chain_id in cls.TOKEN_REGISTRY:
-            token_data = cls.TOKEN_REGISTRY[chain_id].get(symbol)
-            if token_data:
-                return token_data["address"]
-        return None
+        return cls.TOKEN_ADDRESSES.get(chain_id, {}).get(symbol)
+    
+    @classmethod
+    def get_token_by_address(cls, chain_id, address):
+        """
+        Reverse lookup: registry entry for a token address on a chain.
+        
+        Args:
+            chain_id (int): Chain ID
+            address (str | bytes): Hex address in any case, or raw 20 bytes
+            
+        Returns:
+            TokenInfo: Token entry or None if unknown
+        """
+        return cls._BY_ADDRESS.get((chain_id, _address_key(address)))
     
     @classmethod
     def get_token_decimals(cls, chain_id, symbol):
@@ -144,8 +220,41 @@ class TokenDiscovery:
         Returns:
             int: Token decimals or 18 (default) if not found
         """
-        if chain_id in cls.TOKEN_REGISTRY:
-            token_data = cls.TOKEN_REGISTRY[chain_id].get(symbol)
-            if token_data:
-                return token_data["decimals"]
+        token = cls._BY_SYMBOL.get((chain_id, symbol))
+        if token:
+            return token.decimals
         return 18  # Default to 18 decimals
+
+
+# Checksum every registry address once at import so balanceOf calls and cache
+# keys downstream all see the same canonical spelling, and build one TokenInfo
+# per entry for the flat lookup maps. Addresses and symbols are interned so the
+# same USDC/DAI/WETH strings are shared across chains, caches and sets.
+for _cid, _tokens in TokenDiscovery.TOKEN_REGISTRY.items():
+    for _symbol, _data in _tokens.items():
+        _symbol = sys.intern(_symbol)
+        _data["address"] = sys.intern(to_checksum_address(_data["address"]))
+        _flags = 0
+        if _data.get("native"):
+            _flags |= IS_NATIVE
+        if WRAPPED_NATIVE_SYMBOLS.get(_cid) == _symbol:
+            _flags |= IS_WRAPPED_NATIVE
+        if _symbol in STABLECOIN_SYMBOLS:
+            _flags |= IS_STABLECOIN
+        _info = TokenInfo(
+            symbol=_symbol,
+            address=_data["address"],
+            address_lc=sys.intern(_data["address"].lower()),
+            address_bytes=bytes.fromhex(_data["address"][2:]),
+            decimals=_data["decimals"],
+            scale=10 ** _data["decimals"],
+            scale_dec=decimal_scale(_data["decimals"]),
+            flags=_flags,
+        )
+        TokenDiscovery._BY_ADDRESS[(_cid, _info.address_bytes)] = _info
+        TokenDiscovery._BY_SYMBOL[(_cid, _symbol)] = _info
+
+TokenDiscovery.TOKEN_ADDRESSES.update({
+    cid: {symbol: data["address"] for symbol, data in tokens.items()}
+    for cid, tokens in TokenDiscovery.TOKEN_REGISTRY.items()
+})
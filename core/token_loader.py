@@ -1,10 +1,28 @@
 import requests
 import json
+from requests.adapters import HTTPAdapter
 from web3 import Web3
 
 class TokenLoader:
     # 1inch Token Registry (Aggregates standard tokens across chains)
     URL = "https://tokens.1inch.io/v1.1"
+    
+    # (connect, read) seconds
+    TIMEOUT = (2, 5)
+    
+    # Shared keep-alive session: every chain hits the same host, so later
+    # fetches reuse the pooled TLS connection instead of re-handshaking
+    _session = None
+
+    @classmethod
+    def _get_session(cls):
+        if cls._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            cls._session = session
+        return cls._session
 
     @staticmethod
     def get_tokens(chain_id):
@@ -13,7 +31,7 @@ class TokenLoader:
         """
         print(f"📥 Fetching tokens for Chain {chain_id}...")
         try:
-            res = requests.get(f"{TokenLoader.URL}/{chain_id}")
+            res = TokenLoader._get_session().get(f"{TokenLoader.URL}/{chain_id}", timeout=TokenLoader.TIMEOUT)
             data = res.json()
             
             # Convert dict to clean list [ {symbol, address, decimals} ]
@@ -18,8 +18,10 @@ import sys
 import time
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
+import requests
 from web3 import Web3
 from dotenv import load_dotenv
 
@@ -31,6 +33,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger("HealthMonitor")
 
+# Chains whose gas price is sampled alongside the RPC check
+GAS_TRACKED_CHAINS = frozenset({'Ethereum', 'Polygon', 'Arbitrum'})
+
 class MainnetHealthMonitor:
     """Comprehensive health monitoring for Titan mainnet system"""
     
@@ -49,6 +54,15 @@ class MainnetHealthMonitor:
             'Base': os.getenv('RPC_BASE'),
         }
         
+        # Wallet config is fixed for the process lifetime; validate it once
+        self.executor_addr = os.getenv('EXECUTOR_ADDRESS')
+        private_key = os.getenv('PRIVATE_KEY')
+        self._executor_ok = bool(self.executor_addr) and 'YOUR_' not in self.executor_addr
+        self._private_key_ok = bool(private_key) and 'YOUR_' not in private_key
+        
+        # Keep-alive session for raw JSON-RPC health probes
+        self._session = requests.Session()
+        
         # Metrics storage
         self.metrics = {
             'last_signal_time': None,
@@ -64,40 +78,112 @@ class MainnetHealthMonitor:
         """Check RPC endpoints connectivity and response time"""
         logger.info("🔍 Checking RPC connectivity...")
         
+        configured = []
         for chain_name, rpc_url in self.rpc_endpoints.items():
             if not rpc_url or 'YOUR_' in rpc_url:
                 self.metrics['rpc_status'][chain_name] = {
                     'status': 'NOT_CONFIGURED',
                     'latency_ms': None
                 }
-                continue
-            
-            try:
-                start = time.time()
-                w3 = Web3(Web3.HTTPProvider(rpc_url, request_kwargs={'timeout': 10}))
-                block = w3.eth.block_number
-                latency = (time.time() - start) * 1000
-                
-                self.metrics['rpc_status'][chain_name] = {
-                    'status': 'HEALTHY',
-                    'latency_ms': round(latency, 2),
-                    'block_number': block
-                }
-                logger.info(f"   ✅ {chain_name}: {latency:.2f}ms (block {block})")
-                
-                # Check gas price for major chains
-                if chain_name in ['Ethereum', 'Polygon', 'Arbitrum']:
-                    gas_price_wei = w3.eth.gas_price
-                    gas_price_gwei = gas_price_wei / 1e9
-                    self.metrics['gas_prices'][chain_name] = round(gas_price_gwei, 2)
-                    
-            except Exception as e:
+            else:
+                configured.append((chain_name, rpc_url))
+        if not configured:
+            return
+        
+        # One batched request per chain, all chains in flight at once
+        with ThreadPoolExecutor(max_workers=len(configured)) as pool:
+            results = list(pool.map(lambda item: self._probe_chain(*item), configured))
+        
+        for (chain_name, _), (latency, block, gas_price_wei, error) in zip(configured, results):
+            if error is not None:
                 self.metrics['rpc_status'][chain_name] = {
                     'status': 'ERROR',
                     'latency_ms': None,
-                    'error': str(e)
+                    'error': str(error)
                 }
-                logger.error(f"   ❌ {chain_name}: {str(e)[:50]}")
+                logger.error(f"   ❌ {chain_name}: {str(error)[:50]}")
+                continue
+            
+            self.metrics['rpc_status'][chain_name] = {
+                'status': 'HEALTHY',
+                'latency_ms': round(latency, 2),
+                'block_number': block
+            }
+            logger.info(f"   ✅ {chain_name}: {latency:.2f}ms (block {block})")
+            
+            if gas_price_wei is not None:
+                self.metrics['gas_prices'][chain_name] = round(gas_price_wei / 1e9, 2)
+    
+    def _probe_chain(self, chain_name, rpc_url):
+        """
+        Fetch block number (and gas price for tracked chains) in one round-trip.
+        
+        Returns:
+            tuple: (latency_ms, block_number, gas_price_wei or None, error or None)
+        """
+        calls = [("eth_blockNumber", [])]
+        if chain_name in GAS_TRACKED_CHAINS:
+            calls.append(("eth_gasPrice", []))
+        
+        try:
+            start = time.time()
+            results = self._batch_rpc(rpc_url, calls)
+            latency = (time.time() - start) * 1000
+            gas_price_wei = results[1] if len(calls) > 1 else None
+            return latency, results[0], gas_price_wei, None
+        except Exception as e:
+            return None, None, None, e
+    
+    def _batch_rpc(self, rpc_url, calls):
+        """
+        Send several JSON-RPC calls as a single batch POST.
+        
+        Providers that don't support batches answer with a single error object
+        instead of a list; the calls are then sent one by one.
+        
+        Args:
+            rpc_url: RPC endpoint
+            calls: List of (method, params) tuples
+            
+        Returns:
+            list: Integer results, in the order of calls
+        """
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        resp = self._session.post(rpc_url, json=payload, timeout=10)
+        resp.raise_for_status()
+        body = resp.json()
+        if not isinstance(body, list):
+            return [self._single_rpc(rpc_url, method, params) for method, params in calls]
+        
+        # Batch responses may come back in any order; match them up by id
+        by_id = {item.get("id"): item for item in body if isinstance(item, dict)}
+        results = []
+        for i, (method, _) in enumerate(calls):
+            item = by_id.get(i)
+            if not item or "result" not in item:
+                error = item.get("error") if item else "missing response"
+                raise RuntimeError(f"{method} failed: {error}")
+            results.append(int(item["result"], 16))
+        return results
+    
+    def _single_rpc(self, rpc_url, method, params):
+        """
+        Send one JSON-RPC call.
+        
+        Returns:
+            int: Hex result decoded to an integer
+        """
+        payload = {"jsonrpc": "2.0", "id": 0, "method": method, "params": params}
+        resp = self._session.post(rpc_url, json=payload, timeout=10)
+        resp.raise_for_status()
+        body = resp.json()
+        if not isinstance(body, dict) or "result" not in body:
+            error = body.get("error", "missing result") if isinstance(body, dict) else body
+            raise RuntimeError(f"{method} failed: {error}")
+        return int(body["result"], 16)
     
     def check_signal_processing(self):
         """Check signal file processing metrics"""
@@ -146,15 +232,14 @@ class MainnetHealthMonitor:
         
         logger.info("💳 Checking wallet status...")
         
-        executor_addr = os.getenv('EXECUTOR_ADDRESS')
-        private_key = os.getenv('PRIVATE_KEY')
+        executor_addr = self.executor_addr
         
         # Validate configuration
-        if not executor_addr or 'YOUR_' in executor_addr:
+        if not self._executor_ok:
             logger.error("   ❌ EXECUTOR_ADDRESS not configured!")
             return
         
-        if not private_key or 'YOUR_' in private_key:
+        if not self._private_key_ok:
             logger.error("   ❌ PRIVATE_KEY not configured!")
             return
         
@@ -21,6 +21,7 @@ import logging
 import signal
 import json
 from datetime import datetime
+from enum import Enum
 from threading import Thread, Event
 from pathlib import Path
 from dotenv import load_dotenv
@@ -41,10 +42,34 @@ from ml.brain import OmniBrain
 from ml.cortex.forecaster import MarketForecaster
 from ml.cortex.rl_optimizer import QLearningAgent
 
-class ExecutionMode:
-    """Execution mode constants"""
+class ExecutionMode(str, Enum):
+    """Execution mode constants (members compare equal to their string values)"""
     PAPER = "PAPER"  # Paper trading (simulated execution)
     LIVE = "LIVE"    # Live trading (real execution)
+    
+    def __str__(self):
+        return self.value
+
+_VALID_MODES = frozenset(mode.value for mode in ExecutionMode)
+
+# Startup banner per mode: (log level, message) rows, dispatched by table lookup
+_MODE_BANNERS = {
+    ExecutionMode.PAPER: (
+        (logging.INFO, "      📝 PAPER MODE: Trades will be simulated"),
+        (logging.INFO, "      • Real-time mainnet data: ✓"),
+        (logging.INFO, "      • Real arbitrage calculations: ✓"),
+        (logging.INFO, "      • Blockchain execution: SIMULATED"),
+        (logging.INFO, "      • ML model training: ✓"),
+    ),
+    ExecutionMode.LIVE: (
+        (logging.INFO, "      🔴 LIVE MODE: Real blockchain execution"),
+        (logging.INFO, "      • Real-time mainnet data: ✓"),
+        (logging.INFO, "      • Real arbitrage calculations: ✓"),
+        (logging.INFO, "      • Blockchain execution: LIVE"),
+        (logging.INFO, "      • ML model training: ✓"),
+        (logging.WARNING, "      ⚠️  WARNING: Real funds will be used!"),
+    ),
+}
 
 class MainnetOrchestrator:
     """
@@ -62,12 +87,13 @@ class MainnetOrchestrator:
     """
     
     def __init__(self):
-        self.mode = os.getenv('EXECUTION_MODE', 'PAPER').strip().upper()
+        mode = os.getenv('EXECUTION_MODE', 'PAPER').strip().upper()
         
         # Validate mode immediately (fail fast)
-        if self.mode not in [ExecutionMode.PAPER, ExecutionMode.LIVE]:
-            logger.error(f"Invalid EXECUTION_MODE: '{self.mode}'. Must be PAPER or LIVE")
+        if mode not in _VALID_MODES:
+            logger.error(f"Invalid EXECUTION_MODE: '{mode}'. Must be PAPER or LIVE")
             sys.exit(1)
+        self.mode = ExecutionMode(mode)
         
         self.enable_realtime_training = self._parse_bool(os.getenv('ENABLE_REALTIME_TRAINING', 'true'))
         self.shutdown_event = Event()
@@ -141,21 +167,10 @@ class MainnetOrchestrator:
     def _configure_execution_mode(self):
         """Configure the execution mode for the system"""
         # Store mode in environment for bot.js to read
-        os.environ['TITAN_EXECUTION_MODE'] = self.mode
+        os.environ['TITAN_EXECUTION_MODE'] = self.mode.value
         
-        if self.mode == ExecutionMode.PAPER:
-            logger.info("      📝 PAPER MODE: Trades will be simulated")
-            logger.info("      • Real-time mainnet data: ✓")
-            logger.info("      • Real arbitrage calculations: ✓")
-            logger.info("      • Blockchain execution: SIMULATED")
-            logger.info("      • ML model training: ✓")
-        else:
-            logger.info("      🔴 LIVE MODE: Real blockchain execution")
-            logger.info("      • Real-time mainnet data: ✓")
-            logger.info("      • Real arbitrage calculations: ✓")
-            logger.info("      • Blockchain execution: LIVE")
-            logger.info("      • ML model training: ✓")
-            logger.warning("      ⚠️  WARNING: Real funds will be used!")
+        for level, message in _MODE_BANNERS[self.mode]:
+            logger.log(level, message)
     
     def start_realtime_training(self):
         """Start real-time ML model training thread"""
@@ -1,4 +1,6 @@
+import os
 import time
+import random
 import logging
 import json
 import rustworkx as rx
@@ -7,11 +9,15 @@ from web3 import Web3
 from datetime import datetime
 from eth_abi import encode
 from decimal import Decimal, getcontext
+from types import MappingProxyType
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Core Infrastructure
-from core.config import CHAINS, BALANCER_V3_VAULT, DEX_ROUTERS
-from core.token_discovery import TokenDiscovery
+from core.config import (
+    CONFIGURED_CHAINS, RPC_URLS, ZERO_ADDRESS, BALANCER_V3_VAULT,
+    get_chain_name, get_chain_config, get_router
+)
+from core.token_discovery import TokenDiscovery, decimal_scale
 from routing.bridge_manager import BridgeManager
 from core.titan_commander_core import TitanCommander
 
@@ -29,10 +35,71 @@ logger = logging.getLogger("TitanBrain")
 getcontext().prec = 28
 
 # Constants
-ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+# Gas cost model for a two-hop swap: 300k gas at a flat $2000 ETH, expressed
+# as USD per gwei of gas price so each evaluation is a single multiply
+_GAS_USD_PER_GWEI = Decimal("300000") * Decimal("2000") / Decimal("1e9")
+# Digits have no case, so the prefix is the only spelling that can differ
+_ZERO_ADDRESS_FORMS = frozenset({ZERO_ADDRESS, "0X" + ZERO_ADDRESS[2:]})
 # Chains requiring PoA middleware due to Proof-of-Authority consensus
 # Note: Celo uses BFT consensus but still requires PoA middleware for web3.py compatibility
-POA_CHAINS = [137, 56, 250, 42220]  # Polygon, BSC, Fantom, Celo
+POA_CHAINS = frozenset({137, 56, 250, 42220})  # Polygon, BSC, Fantom, Celo
+
+# Approximate block times (seconds). Gas price only moves when a block lands,
+# so cached quotes expire on the next expected block boundary.
+BLOCK_TIMES = {
+    1: 12.0, 137: 2.0, 42161: 0.25, 10: 2.0,
+    8453: 2.0, 56: 3.0, 43114: 2.0, 250: 1.0
+}
+DEFAULT_BLOCK_TIME = 2.0
+# Dedicated Alchemy endpoints for gas polling (read once; .env is loaded by core.config)
+ALCHEMY_RPC_URLS = MappingProxyType({
+    cid: url for cid, url in (
+        (1, os.getenv('ALCHEMY_RPC_ETH')),
+        (137, os.getenv('ALCHEMY_RPC_POLY')),
+        (42161, os.getenv('ALCHEMY_RPC_ARB')),
+        (10, os.getenv('ALCHEMY_RPC_OPT')),
+        (8453, os.getenv('ALCHEMY_RPC_BASE')),
+    ) if url
+})
+# Slack past the boundary so the new block has propagated to the RPC
+GAS_CACHE_BUFFER = 0.2
+# Skip caching when a boundary is this close; the quote is about to go stale
+GAS_MIN_CACHE_THRESHOLD = 0.3
+# Failing gas endpoints are skipped for min(cap, 2**failures) seconds
+ENDPOINT_BACKOFF_CAP = 60.0
+
+# Major chains with good liquidity: token inventory and intra-chain scans
+SCAN_CHAINS = (1, 137, 42161, 10, 8453, 56, 43114)
+# DEX route variations per chain
+DEX_ROUTES = MappingProxyType({
+    1: (  # Ethereum - most liquid
+        ('UNIV3', 'SUSHI'),
+        ('UNIV3', 'UNIV2'),
+        ('SUSHI', 'UNIV2'),
+    ),
+    137: (  # Polygon
+        ('UNIV3', 'QUICKSWAP'),
+        ('UNIV3', 'SUSHI'),
+        ('QUICKSWAP', 'SUSHI'),
+    ),
+    42161: (  # Arbitrum
+        ('UNIV3', 'SUSHI'),
+        ('UNIV3', 'CAMELOT'),
+        ('SUSHI', 'CAMELOT'),
+    ),
+    10: (('UNIV3', 'SUSHI'),),  # Optimism
+    8453: (('UNIV3', 'SUSHI'),),  # Base
+    56: (('PANCAKE', 'SUSHI'),),  # BSC
+    43114: (('TRADERJOE', 'SUSHI'),),  # Avalanche
+})
+DEFAULT_DEX_ROUTES = (('UNIV3', 'SUSHI'),)
+# Tiered token scanning strategy
+# Tier 1: High-priority stablecoins and major assets (scan every cycle)
+TIER1_TOKENS = ('USDC', 'USDT', 'DAI', 'WETH', 'WBTC', 'ETH')
+# Tier 2: Popular DeFi tokens (scan every 2nd cycle)
+TIER2_TOKENS = ('UNI', 'LINK', 'AAVE', 'CRV', 'MATIC', 'AVAX', 'BNB', 'SNX', 'MKR', 'COMP')
+# Tier 3 is everything else (scan every 5th cycle)
+_TIERED_TOKENS = frozenset(TIER1_TOKENS + TIER2_TOKENS)
 
 def is_zero_address(address: str) -> bool:
     """
@@ -46,7 +113,15 @@ def is_zero_address(address: str) -> bool:
     """
     if not address:
         return True
-    return address.lower() == ZERO_ADDRESS.lower()
+    return address in _ZERO_ADDRESS_FORMS
+
+class GasQuote:
+    """Cached gas price for one chain (slotted: one small object per chain)."""
+    __slots__ = ("gwei", "expires_at")
+    
+    def __init__(self, gwei, expires_at):
+        self.gwei = gwei
+        self.expires_at = expires_at
 
 class ProfitEngine:
     """
@@ -87,6 +162,9 @@ class OmniBrain:
         self.profit_engine = ProfitEngine()
         self.inventory = {} 
         self.web3_connections = {}
+        # Gas-price clients on the Alchemy endpoints, built once per chain so
+        # each poll reuses a warm keep-alive connection
+        self.alchemy_connections = {}
         
         # 2. AI Modules
         self.forecaster = MarketForecaster()
@@ -100,12 +178,10 @@ class OmniBrain:
         logger.info(f"Signal output directory: {self.signals_dir}")
         
         # 4. Wallet Configuration
-        import os
-        self.wallet_address = os.getenv('EXECUTOR_ADDRESS', '0x0000000000000000000000000000000000000000')
+        self.wallet_address = os.getenv('EXECUTOR_ADDRESS', ZERO_ADDRESS)
         
         # Validate wallet address is configured
-        if self.wallet_address == '0x0000000000000000000000000000000000000000' or \
-           'YOUR' in self.wallet_address.upper():
+        if is_zero_address(self.wallet_address) or 'YOUR' in self.wallet_address.upper():
             logger.warning("⚠️ EXECUTOR_ADDRESS not configured in .env - using placeholder for PAPER mode")
             # Use a valid Ethereum address for API calls (Vitalik's address as placeholder)
             self.wallet_address = "0xd8dA6BF26964aF9D7eEd9e03E53415D37aA96045"
@@ -121,6 +197,13 @@ class OmniBrain:
         self.consecutive_failures = 0
         self.MAX_CONSECUTIVE_FAILURES = 10  # Circuit breaker threshold
         
+        # Gas quotes: {chain_id: GasQuote}
+        self._gas_cache = {}
+        # Per-endpoint backoff: {(source, chain_id): (consecutive_failures, next_try_ts)}
+        self._endpoint_backoff = {}
+        # Loan sizers are stateless per chain: {chain_id: TitanCommander}
+        self._commanders = {}
+        
     def _cleanup_old_signals(self):
         """Clean up old signal files (keep last 100)"""
         try:
@@ -137,14 +220,14 @@ class OmniBrain:
         # A. Load Assets - Dynamic token loading from 1inch API (100+ tokens per chain)
         from core.token_loader import TokenLoader
         
-        target_chains = [1, 137, 42161, 10, 8453, 56, 43114]  # Major chains with good liquidity
         self.inventory = {}
         
-        for chain_id in target_chains:
-            logger.info(f"📥 Loading tokens for chain {chain_id}...")
-            # Get 100+ tokens dynamically from 1inch
-            tokens_list = TokenLoader.get_tokens(chain_id)
-            
+        # Get 100+ tokens dynamically from 1inch; the per-chain fetches are
+        # independent, so run them on the pool and merge in chain order
+        logger.info(f"📥 Loading tokens for {len(SCAN_CHAINS)} chains...")
+        token_lists = self.executor.map(TokenLoader.get_tokens, SCAN_CHAINS)
+        
+        for chain_id, tokens_list in zip(SCAN_CHAINS, token_lists):
             if tokens_list:
                 # Convert to dict format {symbol: {address, decimals}}
                 self.inventory[chain_id] = {}
@@ -162,19 +245,18 @@ class OmniBrain:
                 self.inventory.update(static_tokens)
         
         # B. Initialize Web3 with timeout protection
-        for cid, config in CHAINS.items():
-            if config.get('rpc'):
-                try:
-                    # Add request timeout to prevent hanging
-                    w3 = Web3(Web3.HTTPProvider(
-                        config['rpc'],
-                        request_kwargs={'timeout': 30}  # 30 second timeout for RPC calls
-                    ))
-                    # PoA middleware removed - web3.py v7+ handles PoA chains automatically
-                    self.web3_connections[cid] = w3
-                    logger.debug(f"Web3 connection established for chain {cid}")
-                except Exception as e:
-                    logger.warning(f"Failed to initialize Web3 for chain {cid}: {e}")
+        for cid in CONFIGURED_CHAINS:
+            try:
+                # Add request timeout to prevent hanging
+                w3 = Web3(Web3.HTTPProvider(
+                    RPC_URLS[cid],
+                    request_kwargs={'timeout': 30}  # 30 second timeout for RPC calls
+                ))
+                # PoA middleware removed - web3.py v7+ handles PoA chains automatically
+                self.web3_connections[cid] = w3
+                logger.debug(f"Web3 connection established for chain {cid}")
+            except Exception as e:
+                logger.warning(f"Failed to initialize Web3 for chain {cid}: {e}")
 
         # C. Build Graph
         self._build_graph_nodes()
@@ -198,7 +280,8 @@ class OmniBrain:
 
     def _build_bridge_edges(self):
         logger.info("🌉 Building Virtual Bridge Edges...")
-        for symbol in TokenDiscovery.BRIDGE_ASSETS:
+        # BRIDGE_ASSETS is a set; sort so graph edge order is stable across runs
+        for symbol in sorted(TokenDiscovery.BRIDGE_ASSETS):
             chains_with_asset = [cid for cid in self.inventory if symbol in self.inventory[cid]]
             for i in range(len(chains_with_asset)):
                 for j in range(i + 1, len(chains_with_asset)):
@@ -207,48 +290,83 @@ class OmniBrain:
                     self.graph.add_edge(u, v, {"type": "bridge", "weight": 0.0})
                     self.graph.add_edge(v, u, {"type": "bridge", "weight": 0.0})
 
+    def _gas_cache_ttl(self, chain_id, now):
+        """
+        TTL that ends just after the chain's next expected block.
+        
+        Returns:
+            tuple: (ttl_seconds, should_cache)
+        """
+        block_time = BLOCK_TIMES.get(chain_id, DEFAULT_BLOCK_TIME)
+        until_boundary = block_time - (now % block_time)
+        return until_boundary + GAS_CACHE_BUFFER, until_boundary > GAS_MIN_CACHE_THRESHOLD
+    
     def _get_gas_price(self, chain_id):
-        """Get gas price with Alchemy fallback and safety ceiling"""
-        import os
+        """Get gas price, reusing the last quote until the next block boundary"""
+        now = time.time()
+        quote = self._gas_cache.get(chain_id)
+        if quote is not None and now < quote.expires_at:
+            return quote.gwei
         
-        # Alchemy RPC endpoints for major chains
-        alchemy_map = {
-            1: os.getenv('ALCHEMY_RPC_ETH'),
-            137: os.getenv('ALCHEMY_RPC_POLY'),
-            42161: os.getenv('ALCHEMY_RPC_ARB'),
-            10: os.getenv('ALCHEMY_RPC_OPT'),
-            8453: os.getenv('ALCHEMY_RPC_BASE')
-        }
+        gwei_price = self._fetch_gas_price(chain_id)
+        ttl, should_cache = self._gas_cache_ttl(chain_id, now)
+        # Failed fetches (0.0) are never cached so the next cycle retries
+        if gwei_price and should_cache:
+            self._gas_cache[chain_id] = GasQuote(gwei_price, now + ttl)
+        return gwei_price
+    
+    def _endpoint_available(self, key, now):
+        """False while an endpoint is still backing off after failures."""
+        state = self._endpoint_backoff.get(key)
+        return state is None or now >= state[1]
+    
+    def _record_endpoint_failure(self, key, now):
+        failures = self._endpoint_backoff.get(key, (0, 0.0))[0]
+        self._endpoint_backoff[key] = (failures + 1, now + min(ENDPOINT_BACKOFF_CAP, 2 ** failures))
+    
+    def _fetch_gas_price(self, chain_id):
+        """Get gas price with Alchemy fallback and safety ceiling"""
+        now = time.time()
         
         # Always use Alchemy for supported chains to avoid rate limits
-        if chain_id in alchemy_map and alchemy_map[chain_id]:
+        alchemy_url = ALCHEMY_RPC_URLS.get(chain_id)
+        alchemy_key = ('alchemy', chain_id)
+        if alchemy_url and self._endpoint_available(alchemy_key, now):
             try:
-                w3 = Web3(Web3.HTTPProvider(alchemy_map[chain_id], request_kwargs={'timeout': 5}))
+                w3 = self.alchemy_connections.get(chain_id)
+                if w3 is None:
+                    w3 = Web3(Web3.HTTPProvider(alchemy_url, request_kwargs={'timeout': 5}))
+                    self.alchemy_connections[chain_id] = w3
                 wei_price = w3.eth.gas_price
+                self._endpoint_backoff.pop(alchemy_key, None)
                 gwei_price = w3.from_wei(wei_price, 'gwei')
                 
                 if gwei_price > float(self.MAX_GAS_PRICE_GWEI):
-                    logger.warning(f"⚠️ Gas price {gwei_price} exceeds max {self.MAX_GAS_PRICE_GWEI} on chain {chain_id}")
+                    logger.warning("⚠️ Gas price %s exceeds max %s on chain %s", gwei_price, self.MAX_GAS_PRICE_GWEI, chain_id)
                     return float(self.MAX_GAS_PRICE_GWEI)
                     
                 return gwei_price
             except Exception as e:
-                logger.debug(f"Alchemy gas fetch failed for chain {chain_id}: {e}")
+                self._record_endpoint_failure(alchemy_key, now)
+                logger.debug("Alchemy gas fetch failed for chain %s: %s", chain_id, e)
         
         # Fallback to configured RPC
+        rpc_key = ('rpc', chain_id)
         try:
-            if chain_id in self.web3_connections:
+            if chain_id in self.web3_connections and self._endpoint_available(rpc_key, now):
                 w3 = self.web3_connections[chain_id]
                 wei_price = w3.eth.gas_price
+                self._endpoint_backoff.pop(rpc_key, None)
                 gwei_price = w3.from_wei(wei_price, 'gwei')
                 
                 if gwei_price > float(self.MAX_GAS_PRICE_GWEI):
-                    logger.warning(f"⚠️ Gas price {gwei_price} exceeds max {self.MAX_GAS_PRICE_GWEI} on chain {chain_id}")
+                    logger.warning("⚠️ Gas price %s exceeds max %s on chain %s", gwei_price, self.MAX_GAS_PRICE_GWEI, chain_id)
                     return float(self.MAX_GAS_PRICE_GWEI)
                     
                 return gwei_price
         except Exception as e:
-            logger.debug(f"Gas price fetch failed for chain {chain_id}: {e}")
+            self._record_endpoint_failure(rpc_key, now)
+            logger.debug("Gas price fetch failed for chain %s: %s", chain_id, e)
         
         # Silently return 0 if all RPCs fail (rate limited)
         return 0.0
@@ -260,77 +378,34 @@ class OmniBrain:
         """
         opportunities = []
         
-        # Target chains with deep liquidity
-        target_chains = [1, 137, 42161, 10, 8453, 56, 43114]
-        
-        # DEX route variations per chain
-        dex_routes = {
-            1: [  # Ethereum - most liquid
-                ('UNIV3', 'SUSHI'),
-                ('UNIV3', 'UNIV2'),
-                ('SUSHI', 'UNIV2'),
-            ],
-            137: [  # Polygon
-                ('UNIV3', 'QUICKSWAP'),
-                ('UNIV3', 'SUSHI'),
-                ('QUICKSWAP', 'SUSHI'),
-            ],
-            42161: [  # Arbitrum
-                ('UNIV3', 'SUSHI'),
-                ('UNIV3', 'CAMELOT'),
-                ('SUSHI', 'CAMELOT'),
-            ],
-            10: [  # Optimism
-                ('UNIV3', 'SUSHI'),
-            ],
-            8453: [  # Base
-                ('UNIV3', 'SUSHI'),
-            ],
-            56: [  # BSC
-                ('PANCAKE', 'SUSHI'),
-            ],
-            43114: [  # Avalanche
-                ('TRADERJOE', 'SUSHI'),
-            ]
-        }
-        
-        # Tiered token scanning strategy
-        # Tier 1: High-priority stablecoins and major assets (scan every cycle)
-        tier1_tokens = ['USDC', 'USDT', 'DAI', 'WETH', 'WBTC', 'ETH']
-        
-        # Tier 2: Popular DeFi tokens (scan every 2nd cycle)
-        tier2_tokens = ['UNI', 'LINK', 'AAVE', 'CRV', 'MATIC', 'AVAX', 'BNB', 'SNX', 'MKR', 'COMP']
-        
-        # Tier 3: All other tokens (scan every 5th cycle)
+        # Tier cadence (see TIER1_TOKENS / TIER2_TOKENS) is keyed off the scan counter
         scan_counter = getattr(self, '_scan_counter', 0)
         self._scan_counter = scan_counter + 1
         
-        for chain_id in target_chains:
+        for chain_id in SCAN_CHAINS:
             if chain_id not in self.inventory:
                 continue
             
             tokens = self.inventory[chain_id]
-            routes = dex_routes.get(chain_id, [('UNIV3', 'SUSHI')])
+            routes = DEX_ROUTES.get(chain_id, DEFAULT_DEX_ROUTES)
             
             # Build token list based on tier priority
             tokens_to_scan = []
             
             # Always scan Tier 1
-            for token_sym in tier1_tokens:
+            for token_sym in TIER1_TOKENS:
                 if token_sym in tokens:
                     tokens_to_scan.append(token_sym)
             
             # Scan Tier 2 every 2nd cycle
             if scan_counter % 2 == 0:
-                for token_sym in tier2_tokens:
+                for token_sym in TIER2_TOKENS:
                     if token_sym in tokens and token_sym not in tokens_to_scan:
                         tokens_to_scan.append(token_sym)
             
             # Scan Tier 3 every 5th cycle (random sample of 20 tokens)
             if scan_counter % 5 == 0:
-                import random
-                tier3_tokens = [sym for sym in tokens.keys() 
-                               if sym not in tier1_tokens and sym not in tier2_tokens]
+                tier3_tokens = [sym for sym in tokens if sym not in _TIERED_TOKENS]
                 if tier3_tokens:
                     sampled_tokens = random.sample(tier3_tokens, min(20, len(tier3_tokens)))
                     tokens_to_scan.extend(sampled_tokens)
@@ -366,18 +441,30 @@ class OmniBrain:
             route_name = opp.get('route_name', 'UNIV3→SUSHI')
             dex1, dex2 = opp.get('route', ('UNIV3', 'SUSHI'))
             
-            logger.info(f"🔎 {token_sym} Chain{src_chain} {route_name}")
+            logger.info("🔎 %s Chain%s %s", token_sym, src_chain, route_name)
             
             token_addr = opp['token_addr_src']
             decimals = opp['decimals']
             
             # 1. TEST MULTIPLE TRADE SIZES (README: optimize for $1.50-$10 profit)
             trade_sizes_usd = [500, 1000, 2000, 5000]  # Test various depths
-            commander = TitanCommander(src_chain)
+            commander = self._commanders.get(src_chain)
+            if commander is None:
+                commander = self._commanders.setdefault(src_chain, TitanCommander(src_chain))
+            scale = decimal_scale(decimals)
+            unit = 10**decimals
+            
+            # Gas does not depend on trade size; price it once per opportunity
+            gas_price_gwei = chain_gas_map.get(src_chain, 0)
+            gas_cost_usd = None
+            if gas_price_gwei:
+                if not isinstance(gas_price_gwei, Decimal):
+                    gas_price_gwei = Decimal(str(gas_price_gwei))
+                gas_cost_usd = gas_price_gwei * _GAS_USD_PER_GWEI
             
             # Find best profitable size
             for target_trade_usd in trade_sizes_usd:
-                target_raw = target_trade_usd * (10**decimals)
+                target_raw = target_trade_usd * unit
                 safe_amount = commander.optimize_loan_size(token_addr, target_raw, decimals)
                 
                 if safe_amount == 0:
@@ -387,14 +474,14 @@ class OmniBrain:
                 try:
                     w3 = self.web3_connections.get(src_chain)
                     if not w3:
-                        logger.info(f"❌ {token_sym}: No Web3 for chain {src_chain}")
+                        logger.info("❌ %s: No Web3 for chain %s", token_sym, src_chain)
                         return False
                     
                     pricer = DexPricer(w3, src_chain)
                     weth_addr = self.inventory[src_chain].get('WETH', {}).get('address')
                     
                     if not weth_addr:
-                        logger.info(f"❌ {token_sym}: No WETH on chain {src_chain}")
+                        logger.info("❌ %s: No WETH on chain %s", token_sym, src_chain)
                         return False
                     
                     # STEP 1: Token → WETH using DEX1
@@ -417,16 +504,12 @@ class OmniBrain:
                         continue  # Try next size
                     
                     # Calculate profit
-                    revenue_usd = Decimal(step2_out) / Decimal(10**decimals)
-                    cost_usd = Decimal(safe_amount) / Decimal(10**decimals)
+                    revenue_usd = Decimal(step2_out) / scale
+                    cost_usd = Decimal(safe_amount) / scale
                     
-                    gas_price_gwei = chain_gas_map.get(src_chain, 0)
-                    if gas_price_gwei == 0:
+                    if gas_cost_usd is None:
                         continue
                     
-                    eth_price = Decimal("2000")
-                    gas_cost_usd = Decimal(str(gas_price_gwei)) * Decimal("300000") * eth_price / Decimal("1e9")
-                    
                     result = self.profit_engine.calculate_enhanced_profit(
                         amount=cost_usd,
                         amount_out=revenue_usd,
@@ -436,13 +519,13 @@ class OmniBrain:
                     
                     if result['is_profitable'] and result['net_profit'] >= self.MIN_PROFIT_THRESHOLD_USD:
                         # Found profitable trade at this size!
-                        logger.info(f"💰 PROFIT: {token_sym} ${target_trade_usd} {route_name} = ${result['net_profit']:.2f}")
+                        logger.info("💰 PROFIT: %s $%s %s = $%.2f", token_sym, target_trade_usd, route_name, result['net_profit'])
                         
                         # Continue with signal generation...
                         break  # Use this size
                         
                 except Exception as e:
-                    logger.debug(f"Size ${target_trade_usd} failed: {e}")
+                    logger.debug("Size $%s failed: %s", target_trade_usd, e)
                     continue
             
             else:
@@ -452,25 +535,22 @@ class OmniBrain:
             # If we get here, we found profitable trade with variables: safe_amount, step1_out, step2_out, result
             # 4. PAYLOAD CONSTRUCTION - Using specific DEX route
             try:
-                chain_conf = CHAINS.get(src_chain)
+                chain_conf = get_chain_config(src_chain)
                 if not chain_conf:
                     return False
                 
-                # Get router addresses based on route
-                from core.config import DEX_ROUTERS
-                
                 # Get router for DEX1
                 if dex1 == 'UNIV3':
                     router1 = chain_conf.get('uniswap_router', ZERO_ADDRESS)
                     protocol1 = 1  # UniV3
                     extra1 = "0x" + encode(['uint24'], [500]).hex()  # 0.05% fee
                 else:
-                    router1 = DEX_ROUTERS.get(src_chain, {}).get(dex1, ZERO_ADDRESS)
+                    router1 = get_router(dex1, src_chain)
                     protocol1 = 0  # UniV2-style
                     extra1 = "0x"
                 
                 # Get router for DEX2
-                router2 = DEX_ROUTERS.get(src_chain, {}).get(dex2, ZERO_ADDRESS)
+                router2 = get_router(dex2, src_chain)
                 protocol2 = 0  # All second hops are V2-style
                 extra2 = "0x"
                 
@@ -483,7 +563,7 @@ class OmniBrain:
                 extras = [extra1, extra2]
                 
             except Exception as e:
-                logger.error(f"Payload construction failed: {e}")
+                logger.error("Payload construction failed: %s", e)
                 return False
 
             # 6. AI TUNING
@@ -492,7 +572,7 @@ class OmniBrain:
                 
                 # Validate AI parameters
                 if exec_params.get('slippage', 0) > self.MAX_SLIPPAGE_BPS:
-                    logger.warning(f"AI slippage {exec_params['slippage']} exceeds max {self.MAX_SLIPPAGE_BPS}, capping")
+                    logger.warning("AI slippage %s exceeds max %s, capping", exec_params['slippage'], self.MAX_SLIPPAGE_BPS)
                     exec_params['slippage'] = self.MAX_SLIPPAGE_BPS
                 
                 max_priority = float(self.MAX_GAS_PRICE_GWEI) / 2
@@ -500,10 +580,12 @@ class OmniBrain:
                     exec_params['priority'] = int(max_priority)
                     
             except Exception as e:
-                logger.error(f"AI parameter tuning failed: {e}")
+                logger.error("AI parameter tuning failed: %s", e)
                 exec_params = {"slippage": 50, "priority": 30}
 
             # 7. BROADCAST
+            # One clock read serves both the payload timestamp and the filename
+            now_ns = time.time_ns()
             signal = {
                 "type": "INTRA_CHAIN",
                 "chainId": src_chain,
@@ -521,44 +603,46 @@ class OmniBrain:
                     "step1_output": step1_out,
                     "step2_output": step2_out
                 },
-                "timestamp": datetime.now().isoformat()
+                "timestamp": datetime.fromtimestamp(now_ns / 1e9).isoformat()
             }
 
             # Signal generated successfully with detailed info
-            logger.info(f"⚡ SIGNAL GENERATED: {token_sym} on Chain {src_chain}")
-            logger.info(f"   💰 Profit: ${result['net_profit']:.2f} | Fees: ${result['total_fees']:.2f}")
-            logger.info(f"   🔄 Route: {' -> '.join(protocols)}")
-            logger.info(f"   ⛽ Gas: {chain_gas_map.get(src_chain, 0):.1f} Gwei")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("⚡ SIGNAL GENERATED: %s on Chain %s", token_sym, src_chain)
+                logger.info("   💰 Profit: $%.2f | Fees: $%.2f", result['net_profit'], result['total_fees'])
+                logger.info("   🔄 Route: %s", route_name)
+                logger.info("   ⛽ Gas: %.1f Gwei", chain_gas_map.get(src_chain, 0))
             self.consecutive_failures = 0
             
             # Write signal to file for bot.js consumption
-            self._write_signal_to_file(signal)
+            self._write_signal_to_file(signal, token_sym, now_ns // 1_000_000)
             
             return True  # Signal generated successfully
                 
         except Exception as e:
-            logger.error(f"Unexpected error in _evaluate_and_signal for {opp.get('token', 'unknown')}: {e}")
+            logger.error("Unexpected error in _evaluate_and_signal for %s: %s", opp.get('token', 'unknown'), e)
             self.consecutive_failures += 1
             return False
 
-    def _write_signal_to_file(self, signal):
+    def _write_signal_to_file(self, signal, token_symbol, timestamp=None):
         """Write signal to JSON file for bot.js consumption"""
         try:
-            timestamp = int(time.time() * 1000)
-            filename = f"signal_{timestamp}_{signal['token_symbol']}.json"
-            filepath = os.path.join(self.signals_dir, filename)
+            if timestamp is None:
+                timestamp = time.time_ns() // 1_000_000
+            filename = f"signal_{timestamp}_{token_symbol}.json"
             
-            with open(filepath, 'w') as f:
-                json.dump(signal, f, indent=2)
+            # Serialize once, compactly, and hand the whole payload to a single write
+            payload = json.dumps(signal, separators=(',', ':'))
+            (self.signals_dir / filename).write_text(payload)
             
-            logger.info(f"📄 Signal written to: {filename}")
+            logger.info("📄 Signal written to: %s", filename)
             
             # Cleanup old signals periodically
             if timestamp % 60000 < 1000:  # Roughly every minute
                 self._cleanup_old_signals()
                 
         except Exception as e:
-            logger.error(f"Failed to write signal file: {e}")
+            logger.error("Failed to write signal file: %s", e)
 
     def scan_loop(self):
         logger.info("🚀 Titan Brain: Engaging Hyper-Parallel Scan Loop...")
@@ -568,14 +652,14 @@ class OmniBrain:
         total_chains = len(self.inventory)
         logger.info(f"📊 Coverage: {total_tokens} tokens across {total_chains} chains")
         for chain_id, tokens in self.inventory.items():
-            chain_name = CHAINS.get(chain_id, {}).get('name', f'Chain {chain_id}')
+            chain_name = get_chain_name(chain_id)
             logger.info(f"   • {chain_name}: {len(tokens)} tokens")
         
         while True:
             try:
                 # Circuit breaker check
                 if self.consecutive_failures >= self.MAX_CONSECUTIVE_FAILURES:
-                    logger.error(f"🛑 CIRCUIT BREAKER TRIGGERED: {self.consecutive_failures} consecutive failures")
+                    logger.error("🛑 CIRCUIT BREAKER TRIGGERED: %d consecutive failures", self.consecutive_failures)
                     logger.info("⏸️ Pausing for 60 seconds before retry...")
                     time.sleep(60)
                     self.consecutive_failures = 0  # Reset after cooldown
@@ -593,7 +677,7 @@ class OmniBrain:
                             gas_price = f.result()
                             chain_gas_map[chain_id] = gas_price
                         except Exception as e:
-                            logger.warning(f"Failed to get gas price for chain: {e}")
+                            logger.warning("Failed to get gas price for chain: %s", e)
                             
                     if not chain_gas_map:
                         logger.warning("No gas prices available, waiting before retry")
@@ -601,7 +685,7 @@ class OmniBrain:
                         continue
                         
                 except Exception as e:
-                    logger.error(f"Gas check failed: {e}")
+                    logger.error("Gas check failed: %s", e)
                     time.sleep(5)
                     continue
 
@@ -611,7 +695,7 @@ class OmniBrain:
                     if poly_gas > 0:
                         # Check if gas price is within acceptable range
                         if poly_gas > float(self.MAX_GAS_PRICE_GWEI):
-                            logger.warning(f"⚠️ Polygon gas price {poly_gas} exceeds maximum, waiting...")
+                            logger.warning("⚠️ Polygon gas price %s exceeds maximum, waiting...", poly_gas)
                             time.sleep(10)
                             continue
                             
@@ -621,7 +705,7 @@ class OmniBrain:
                             time.sleep(2)
                             continue
                 except Exception as e:
-                    logger.warning(f"Gas forecast check failed: {e}")
+                    logger.warning("Gas forecast check failed: %s", e)
                     # Continue anyway as this is not critical
                 
                 # 3. FIND PATHS with error handling
@@ -632,9 +716,9 @@ class OmniBrain:
                         time.sleep(5)
                         continue
                     
-                    logger.info(f"🔍 Found {len(candidates)} potential opportunities")
+                    logger.info("🔍 Found %d potential opportunities", len(candidates))
                 except Exception as e:
-                    logger.error(f"Opportunity discovery failed: {e}")
+                    logger.error("Opportunity discovery failed: %s", e)
                     time.sleep(5)
                     continue
 
@@ -654,12 +738,12 @@ class OmniBrain:
                             if result:  # If signal was generated
                                 signals_generated += 1
                         except Exception as e:
-                            logger.error(f"Worker evaluation error: {e}")
+                            logger.error("Worker evaluation error: %s", e)
                             
-                    logger.info(f"📊 Cycle complete: {completed}/{len(candidates)} evaluated, {signals_generated} signals generated")
+                    logger.info("📊 Cycle complete: %d/%d evaluated, %d signals generated", completed, len(candidates), signals_generated)
                     
                 except Exception as e:
-                    logger.error(f"Parallel evaluation failed: {e}")
+                    logger.error("Parallel evaluation failed: %s", e)
 
                 # Sleep between cycles
                 time.sleep(1)
@@ -669,7 +753,7 @@ class OmniBrain:
                 self.executor.shutdown(wait=True)
                 break
             except Exception as e:
-                logger.error(f"Unexpected error in scan loop: {e}")
+                logger.error("Unexpected error in scan loop: %s", e)
                 time.sleep(5)
 
 if __name__ == "__main__":
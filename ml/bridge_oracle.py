@@ -23,7 +23,9 @@ class BridgeOracle:
     def __init__(self, min_profit_threshold_usd=5.0):
         self.aggregator = BridgeAggregator()
         self.lifi = LiFiWrapper()
-        self.min_profit_threshold_usd = Decimal(str(min_profit_threshold_usd))
+        if not isinstance(min_profit_threshold_usd, Decimal):
+            min_profit_threshold_usd = Decimal(str(min_profit_threshold_usd))
+        self.min_profit_threshold_usd = min_profit_threshold_usd
     
     def get_bridge_cost(self, src_chain, dst_chain, token, amount):
         """
@@ -56,7 +58,9 @@ class BridgeOracle:
             if not route:
                 return None
             
-            fee_usd = Decimal(str(route.get('fee_usd', 0)))
+            fee_usd = route.get('fee_usd', 0)
+            if not isinstance(fee_usd, Decimal):
+                fee_usd = Decimal(str(fee_usd))
             
             return {
                 'fee_usd': fee_usd,
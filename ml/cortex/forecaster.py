@@ -1,3 +1,4 @@
+from collections import deque
 import numpy as np
 import pandas as pd
 
@@ -7,13 +8,12 @@ class MarketForecaster:
     """
     
     def __init__(self, history_window=50):
-        self.gas_history = []
+        # Bounded ring buffer: appends evict the oldest sample in O(1)
+        self.gas_history = deque(maxlen=history_window)
         self.window = history_window
 
     def ingest_gas(self, gwei):
         self.gas_history.append(gwei)
-        if len(self.gas_history) > self.window:
-            self.gas_history.pop(0)
 
     def predict_gas_trend(self):
         """
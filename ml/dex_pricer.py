@@ -1,6 +1,8 @@
 import logging
 from web3 import Web3
-from core.config import DEX_ROUTERS, CHAINS
+from eth_abi import encode, decode
+from core.config import CHAINS, MULTICALL3_ADDRESS, UNISWAP_V3_QUOTER_V2, get_router
+from core.single_flight import single_flight
 
 # Setup Logging
 logger = logging.getLogger("DexPricer")
@@ -18,7 +20,16 @@ CURVE_ABI = '[{"stateMutability":"view","type":"function","name":"get_dy","input
 # Maximum number of coins to check in a Curve pool (most pools have 2-4 coins)
 MAX_CURVE_COINS = 8
 
+# Multicall3 (address lives in core.config)
+MULTICALL3_ABI = '[{"inputs":[{"components":[{"internalType":"address","name":"target","type":"address"},{"internalType":"bool","name":"allowFailure","type":"bool"},{"internalType":"bytes","name":"callData","type":"bytes"}],"internalType":"struct Multicall3.Call3[]","name":"calls","type":"tuple[]"}],"name":"aggregate3","outputs":[{"components":[{"internalType":"bool","name":"success","type":"bool"},{"internalType":"bytes","name":"returnData","type":"bytes"}],"internalType":"struct Multicall3.Result[]","name":"returnData","type":"tuple[]"}],"stateMutability":"payable","type":"function"}]'
+
+# coins(uint256) selector, used to build Multicall3 calldata without a contract object
+CURVE_COINS_SELECTOR = bytes(Web3.keccak(text="coins(uint256)")[:4])
+
 class DexPricer:
+    # One pricer per chain is created in scan loops; slots keep it small and fast
+    __slots__ = ("w3", "chain_id", "config", "_pool_coins_cache", "block_identifier")
+    
     def __init__(self, w3: Web3, chain_id: int):
         self.w3 = w3
         self.chain_id = chain_id
@@ -48,18 +59,21 @@ class DexPricer:
                 abi=CURVE_ABI
             )
             
-            coin_map = {}
+            coin_map = self._get_pool_coins_multicall(pool.address)
             
-            for i in range(MAX_CURVE_COINS):
-                try:
-                    # Use configurable block identifier for performance tuning
-                    coin_addr = pool.functions.coins(i).call(block_identifier=self.block_identifier)
-                    coin_map[coin_addr.lower()] = i
-                    logger.debug(f"Pool {pool_address[:8]}: coins({i}) = {coin_addr}")
-                except Exception as e:
-                    # Pool has no more coins at this index (expected behavior)
-                    logger.debug(f"No coin at index {i} for pool {pool_address[:8]}: {e}")
-                    break
+            if coin_map is None:
+                # Multicall3 unavailable: one eth_call per index
+                coin_map = {}
+                for i in range(MAX_CURVE_COINS):
+                    try:
+                        # Use configurable block identifier for performance tuning
+                        coin_addr = pool.functions.coins(i).call(block_identifier=self.block_identifier)
+                        coin_map[coin_addr.lower()] = i
+                        logger.debug(f"Pool {pool_address[:8]}: coins({i}) = {coin_addr}")
+                    except Exception as e:
+                        # Pool has no more coins at this index (expected behavior)
+                        logger.debug(f"No coin at index {i} for pool {pool_address[:8]}: {e}")
+                        break
             
             if len(coin_map) < 2:
                 logger.warning(f"Pool {pool_address} has insufficient coins: {len(coin_map)}")
@@ -75,6 +89,35 @@ class DexPricer:
             logger.error(f"Failed to query pool coins: {e}")
             return {}
 
+    def _get_pool_coins_multicall(self, pool_address: str):
+        """
+        Read coins(0..MAX_CURVE_COINS-1) in a single Multicall3 aggregate3 call.
+        
+        Indices past the end of the pool revert; with allowFailure those come
+        back as unsuccessful results and mark where the coin list stops.
+        
+        Returns:
+            dict: {token_address_lowercase: index}, or None if the multicall failed
+        """
+        calls = [
+            (pool_address, True, CURVE_COINS_SELECTOR + encode(['uint256'], [i]))
+            for i in range(MAX_CURVE_COINS)
+        ]
+        try:
+            multicall = self.w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+            results = multicall.functions.aggregate3(calls).call(block_identifier=self.block_identifier)
+        except Exception as e:
+            logger.debug(f"Multicall3 coins() lookup failed for pool {pool_address[:8]}: {e}")
+            return None
+        
+        coin_map = {}
+        for i, (success, return_data) in enumerate(results):
+            if not success or len(return_data) < 32:
+                break
+            coin_addr = decode(['address'], return_data)[0]
+            coin_map[coin_addr.lower()] = i
+        return coin_map
+
     def get_curve_indices(self, pool_address: str, token_in: str, token_out: str) -> tuple:
         """
         Dynamically resolves the correct Curve indices for a token pair.
@@ -135,7 +178,14 @@ class DexPricer:
         Note: Returns 0 for both "no liquidity" and "RPC error" cases.
               Check logs to distinguish between failure modes.
         """
-        quoter_addr = "0x61fFE014bA17989E743c5F6cB21bF9697530B21e" 
+        key = ("univ3", self.chain_id, token_in, token_out, int(amount), fee, self.block_identifier)
+        return single_flight(key, lambda: self._quote_univ3(token_in, token_out, amount, fee))
+    
+    def _quote_univ3(self, token_in, token_out, amount, fee):
+        quoter_addr = UNISWAP_V3_QUOTER_V2.get(self.chain_id)
+        if not quoter_addr:
+            logger.debug(f"No Uniswap V3 QuoterV2 on chain {self.chain_id}")
+            return 0
         
         try:
             contract = self.w3.eth.contract(address=quoter_addr, abi=UNIV3_ABI)
@@ -216,11 +266,15 @@ class DexPricer:
         Returns:
             int: Output amount in wei, or 0 if query fails
         """
-        router_addr = DEX_ROUTERS.get(self.chain_id, {}).get(router_key)
+        router_addr = get_router(router_key, self.chain_id)
         if not router_addr:
             logger.debug(f"Router {router_key} not configured for chain {self.chain_id}")
             return 0
         
+        key = ("univ2", self.chain_id, router_addr, token_in, token_out, int(amount), self.block_identifier)
+        return single_flight(key, lambda: self._quote_univ2(router_key, router_addr, token_in, token_out, amount))
+    
+    def _quote_univ2(self, router_key, router_addr, token_in, token_out, amount):
         try:
             contract = self.w3.eth.contract(address=router_addr, abi=UNIV2_ABI)
             amounts = contract.functions.getAmountsOut(
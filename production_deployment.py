@@ -15,6 +15,8 @@ import os
 import sys
 import json
 import logging
+import re
+from functools import cached_property
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Tuple
@@ -26,6 +28,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger("ProductionDeployment")
 
+# 32-byte hex key, optional 0x prefix; format is checked without decoding
+_PRIVATE_KEY_RE = re.compile(r'\A(?:0x)?[0-9a-fA-F]{64}\Z')
+
+# RPC config-health table: (env var, chain name, required)
+RPC_CHECKS = (
+    ('RPC_ETHEREUM', 'Ethereum', True),
+    ('RPC_POLYGON', 'Polygon', True),
+    ('RPC_ARBITRUM', 'Arbitrum', True),
+    ('RPC_OPTIMISM', 'Optimism', True),
+    ('RPC_BASE', 'Base', True),
+    ('RPC_BSC', 'BSC', False),
+    ('RPC_AVALANCHE', 'Avalanche', False),
+    ('RPC_FANTOM', 'Fantom', False),
+)
+
 class ProductionDeploymentManager:
     """Manages full production deployment with all features"""
     
@@ -33,45 +50,45 @@ class ProductionDeploymentManager:
         self.deployment_config = {}
         self.validation_results = {}
         self.feature_status = {}
+    
+    @cached_property
+    def safety_params(self) -> Dict[str, float]:
+        """
+        Safety limits parsed from the environment once per manager.
+        
+        A malformed value raises ValueError here, on first access, rather than
+        part-way through a validation run. Call invalidate() to re-read.
+        """
+        return {
+            'max_gas_gwei': float(os.getenv('MAX_BASE_FEE_GWEI', '500')),
+            'min_profit_usd': float(os.getenv('MIN_PROFIT_USD', '1.0')),
+            'min_profit_cross_usd': float(os.getenv('MIN_PROFIT_CROSS_CHAIN_USD', '10.0')),
+            'max_slippage_bps': int(os.getenv('MAX_SLIPPAGE_BPS', '100')),
+            'max_tvl_share': float(os.getenv('MAX_TVL_SHARE', '0.20')),
+            'max_failures': int(os.getenv('MAX_CONSECUTIVE_FAILURES', '10')),
+        }
+    
+    def invalidate(self):
+        """Drop cached configuration so the next validation re-reads .env values."""
+        self.__dict__.pop('safety_params', None)
         
     def validate_rpc_endpoints(self) -> Tuple[bool, List[str]]:
         """Validate all RPC endpoints are configured"""
         logger.info("🌐 Validating RPC endpoints...")
         
-        required_chains = {
-            'RPC_ETHEREUM': 'Ethereum',
-            'RPC_POLYGON': 'Polygon',
-            'RPC_ARBITRUM': 'Arbitrum',
-            'RPC_OPTIMISM': 'Optimism',
-            'RPC_BASE': 'Base'
-        }
-        
-        optional_chains = {
-            'RPC_BSC': 'BSC',
-            'RPC_AVALANCHE': 'Avalanche',
-            'RPC_FANTOM': 'Fantom'
-        }
-        
         warnings = []
         configured = []
         
-        # Check required chains
-        for env_var, name in required_chains.items():
+        # Single pass over the table; optional chains only log when present
+        for env_var, name, required in RPC_CHECKS:
             value = os.getenv(env_var, '')
             if value and 'YOUR_' not in value.upper():
                 configured.append(name)
-                logger.info(f"   ✅ {name}: Configured")
-            else:
+                logger.info(f"   ✅ {name}: Configured" if required else f"   ✅ {name}: Configured (optional)")
+            elif required:
                 warnings.append(f"Missing required RPC: {name}")
                 logger.error(f"   ❌ {name}: NOT CONFIGURED")
         
-        # Check optional chains
-        for env_var, name in optional_chains.items():
-            value = os.getenv(env_var, '')
-            if value and 'YOUR_' not in value.upper():
-                configured.append(name)
-                logger.info(f"   ✅ {name}: Configured (optional)")
-        
         self.validation_results['rpc_chains'] = configured
         return len(warnings) == 0, warnings
     
@@ -90,9 +107,9 @@ class ProductionDeploymentManager:
         if not private_key or 'YOUR_' in private_key.upper():
             warnings.append("PRIVATE_KEY not configured (required for LIVE mode)")
             logger.error("   ❌ PRIVATE_KEY: NOT CONFIGURED")
-        elif len(private_key.replace('0x', '')) != 64:
-            warnings.append("PRIVATE_KEY has invalid length")
-            logger.error("   ❌ PRIVATE_KEY: INVALID LENGTH")
+        elif not _PRIVATE_KEY_RE.match(private_key):
+            warnings.append("PRIVATE_KEY is not a 64-character hex string")
+            logger.error("   ❌ PRIVATE_KEY: INVALID FORMAT")
         else:
             logger.info("   ✅ PRIVATE_KEY: Configured")
         
@@ -134,9 +151,10 @@ class ProductionDeploymentManager:
         logger.info("🛡️  Validating safety limits...")
         
         warnings = []
+        params = self.safety_params
         
         # Gas limits
-        max_gas = float(os.getenv('MAX_BASE_FEE_GWEI', '500'))
+        max_gas = params['max_gas_gwei']
         if max_gas > 1000:
             warnings.append(f"MAX_BASE_FEE_GWEI very high: {max_gas} gwei")
             logger.warning(f"   ⚠️  Max gas price: {max_gas} gwei (HIGH)")
@@ -144,14 +162,14 @@ class ProductionDeploymentManager:
             logger.info(f"   ✅ Max gas price: {max_gas} gwei")
         
         # Profit thresholds
-        min_profit = float(os.getenv('MIN_PROFIT_USD', '1.0'))
+        min_profit = params['min_profit_usd']
         logger.info(f"   ✅ Min profit: ${min_profit}")
         
-        min_profit_cross = float(os.getenv('MIN_PROFIT_CROSS_CHAIN_USD', '10.0'))
+        min_profit_cross = params['min_profit_cross_usd']
         logger.info(f"   ✅ Min profit (cross-chain): ${min_profit_cross}")
         
         # Slippage
-        max_slippage = int(os.getenv('MAX_SLIPPAGE_BPS', '100'))
+        max_slippage = params['max_slippage_bps']
         if max_slippage > 200:
             warnings.append(f"MAX_SLIPPAGE_BPS high: {max_slippage/100}%")
             logger.warning(f"   ⚠️  Max slippage: {max_slippage/100}% (HIGH)")
@@ -159,11 +177,11 @@ class ProductionDeploymentManager:
             logger.info(f"   ✅ Max slippage: {max_slippage/100}%")
         
         # TVL limits
-        max_tvl_share = float(os.getenv('MAX_TVL_SHARE', '0.20'))
+        max_tvl_share = params['max_tvl_share']
         logger.info(f"   ✅ Max TVL share: {max_tvl_share*100}%")
         
         # Circuit breaker
-        max_failures = int(os.getenv('MAX_CONSECUTIVE_FAILURES', '10'))
+        max_failures = params['max_failures']
         logger.info(f"   ✅ Circuit breaker: {max_failures} failures")
         
         return len([w for w in warnings if 'very high' in w.lower()]) == 0, warnings
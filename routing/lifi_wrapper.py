@@ -283,7 +283,9 @@ class LiFiWrapper:
         gross_profit = price_spread_pct * amount_usd
         
         # Subtract bridge and gas costs
-        bridge_fee = Decimal(str(bridge_cost.get('gas_cost_usd', 0)))
+        bridge_fee = bridge_cost.get('gas_cost_usd', 0)
+        if not isinstance(bridge_fee, Decimal):
+            bridge_fee = Decimal(str(bridge_fee))
         net_profit = gross_profit - bridge_fee
         
         # Check if exceeds minimum threshold
@@ -41,7 +41,7 @@ logging.basicConfig(
 logger = logging.getLogger("HistoricalDataFetcher")
 
 # Constants
-POA_CHAINS = [137, 56, 250, 42220]  # Polygon, BSC, Fantom, Celo
+POA_CHAINS = frozenset({137, 56, 250, 42220})  # Polygon, BSC, Fantom, Celo
 SECONDS_PER_DAY = 86400
 
 # Minimal ABIs for historical queries
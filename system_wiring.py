@@ -125,6 +125,7 @@ import os
 import sys
 import json
 import logging
+import functools
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
@@ -134,6 +135,25 @@ load_dotenv()
 
 logger = logging.getLogger("SystemWiring")
 
+# Status table rules and chain labels are fixed; build them once
+_HR = "=" * 70
+_SUBHR = "  " + "-" * 66
+_VALID_MODES = frozenset({'PAPER', 'LIVE'})
+_CHAIN_NAMES = {
+    1: 'Ethereum', 137: 'Polygon', 42161: 'Arbitrum',
+    10: 'Optimism', 8453: 'Base', 56: 'BSC',
+    43114: 'Avalanche', 250: 'Fantom'
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _rendered_chain_lines(chain_ids: tuple) -> tuple:
+    """Render the ENABLED CHAINS rows once per distinct chain set."""
+    return tuple(
+        f"  ✅ {_CHAIN_NAMES.get(chain_id, f'Chain {chain_id}')}"
+        for chain_id in chain_ids
+    )
+
 class SystemIntegrationManager:
     """
     Manages the complete integration and wiring of all Titan components.
@@ -201,7 +221,7 @@ class SystemIntegrationManager:
         warnings = []
         
         # Check execution mode
-        if self.mode not in ['PAPER', 'LIVE']:
+        if self.mode not in _VALID_MODES:
             warnings.append(f"Invalid EXECUTION_MODE: {self.mode} (must be PAPER or LIVE)")
         
         # Check RPC endpoints
@@ -318,46 +338,41 @@ class SystemIntegrationManager:
     
     def print_system_status(self):
         """Print comprehensive system status"""
-        print("\n" + "="*70)
+        print("\n" + _HR)
         print("  🚀 APEX-OMEGA TITAN: SYSTEM STATUS")
-        print("="*70)
+        print(_HR)
         print(f"  Execution Mode: {self.mode}")
         print(f"  Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("")
         
         print("  🔧 COMPONENT STATUS")
-        print("  " + "-"*66)
+        print(_SUBHR)
         for component, status in self.status['components'].items():
             icon = "✅" if status else "❌"
             print(f"  {icon} {component}")
         print("")
         
         print("  🌐 ENABLED CHAINS")
-        print("  " + "-"*66)
-        chain_names = {
-            1: 'Ethereum', 137: 'Polygon', 42161: 'Arbitrum',
-            10: 'Optimism', 8453: 'Base', 56: 'BSC',
-            43114: 'Avalanche', 250: 'Fantom'
-        }
-        for chain_id in self.config['chains_enabled']:
-            print(f"  ✅ {chain_names.get(chain_id, f'Chain {chain_id}')}")
+        print(_SUBHR)
+        for line in _rendered_chain_lines(tuple(self.config['chains_enabled'])):
+            print(line)
         print("")
         
         print("  🎯 FEATURES")
-        print("  " + "-"*66)
+        print(_SUBHR)
         for feature, enabled in self.config['features'].items():
             icon = "✅" if enabled else "⚪"
             print(f"  {icon} {feature.replace('_', ' ').title()}")
         print("")
         
         print("  🛡️  SAFETY LIMITS")
-        print("  " + "-"*66)
+        print(_SUBHR)
         print(f"  Max Gas Price: {self.config['limits']['max_gas_gwei']} gwei")
         print(f"  Min Profit: ${self.config['limits']['min_profit_usd']}")
         print(f"  Max Slippage: {self.config['limits']['max_slippage_bps']/100}%")
         print("")
         
-        print("="*70)
+        print(_HR)
         print("")
     
     def run_diagnostics(self) -> bool:
@@ -0,0 +1,178 @@
+"""
+Test Suite for OmniBrain - Signal output and gas price caching
+
+Tests the file-based signal hand-off to bot.js and the per-chain gas cache
+without booting the brain.
+"""
+
+import unittest
+from unittest import mock
+import tempfile
+import json
+import sys
+import os
+from decimal import Decimal
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ml.brain as brain_mod
+from ml.brain import OmniBrain
+
+
+def make_brain():
+    """Bare OmniBrain with no RPC, model or executor set up"""
+    brain = OmniBrain.__new__(OmniBrain)
+    brain._gas_cache = {}
+    brain._endpoint_backoff = {}
+    brain.alchemy_connections = {}
+    brain.web3_connections = {}
+    brain.MAX_GAS_PRICE_GWEI = Decimal("200.0")
+    return brain
+
+
+class TestSignalFiles(unittest.TestCase):
+    """Test INTRA_CHAIN signal files written for bot.js"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.brain = make_brain()
+        self.brain.signals_dir = Path(self.tmp.name)
+        self.signal = {
+            "type": "INTRA_CHAIN",
+            "chainId": 137,
+            "token": "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174",
+            "amount": "1000000000",
+            "protocols": [1, 0],
+        }
+
+    def test_signal_written_with_symbol_filename(self):
+        """Signal file is named signal_<ms>_<SYMBOL>.json"""
+        self.brain._write_signal_to_file(self.signal, "USDC", 1700000000123)
+
+        self.assertEqual(os.listdir(self.tmp.name), ["signal_1700000000123_USDC.json"])
+
+    def test_signal_payload_round_trips(self):
+        """Payload is the signal dict, serialized as JSON"""
+        self.brain._write_signal_to_file(self.signal, "USDC", 1700000000123)
+
+        written = Path(self.tmp.name, "signal_1700000000123_USDC.json").read_text()
+        self.assertEqual(json.loads(written), self.signal)
+
+    def test_cleanup_keeps_last_100(self):
+        """Old signal files are pruned down to the newest 100"""
+        for ts in range(1000, 1105):
+            Path(self.tmp.name, f"signal_{ts}_USDC.json").write_text("{}")
+
+        self.brain._cleanup_old_signals()
+
+        remaining = sorted(os.listdir(self.tmp.name))
+        self.assertEqual(len(remaining), 100)
+        self.assertEqual(remaining[0], "signal_1005_USDC.json")
+
+
+class TestGasCache(unittest.TestCase):
+    """Test block-aligned gas price caching"""
+
+    def setUp(self):
+        self.now = 1200.0  # On an Ethereum 12s block boundary
+        patcher = mock.patch.object(brain_mod.time, "time", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.brain = make_brain()
+        self.fetch = mock.Mock(return_value=25.0)
+        self.brain._fetch_gas_price = self.fetch
+
+    def test_ttl_ends_after_next_block(self):
+        """TTL runs to the next block boundary plus the propagation buffer"""
+        ttl, should_cache = self.brain._gas_cache_ttl(1, 1203.0)
+
+        self.assertAlmostEqual(ttl, 9.0 + brain_mod.GAS_CACHE_BUFFER)
+        self.assertTrue(should_cache)
+
+    def test_no_cache_right_before_boundary(self):
+        """A quote taken just before a new block is not cached"""
+        _, should_cache = self.brain._gas_cache_ttl(1, 1211.9)
+
+        self.assertFalse(should_cache)
+
+    def test_quote_reused_within_block(self):
+        """The gas price is fetched once per block"""
+        self.assertEqual(self.brain._get_gas_price(1), 25.0)
+        self.now += 11.0
+        self.assertEqual(self.brain._get_gas_price(1), 25.0)
+        self.assertEqual(self.fetch.call_count, 1)
+
+    def test_quote_refetched_after_block(self):
+        """A new block triggers a fresh fetch"""
+        self.brain._get_gas_price(1)
+        self.now += 12.0 + brain_mod.GAS_CACHE_BUFFER
+        self.fetch.return_value = 30.0
+
+        self.assertEqual(self.brain._get_gas_price(1), 30.0)
+        self.assertEqual(self.fetch.call_count, 2)
+
+    def test_failed_fetch_not_cached(self):
+        """A 0.0 (all RPCs failed) result is retried on the next call"""
+        self.fetch.return_value = 0.0
+        self.brain._get_gas_price(1)
+        self.brain._get_gas_price(1)
+
+        self.assertEqual(self.fetch.call_count, 2)
+
+
+class TestEndpointBackoff(unittest.TestCase):
+    """Test per-endpoint exponential backoff in gas fetches"""
+
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch.object(brain_mod.time, "time", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.brain = make_brain()
+        self.w3 = mock.Mock()
+        self.w3.from_wei.side_effect = lambda wei, unit: wei / 1e9
+        self.gas_price = mock.PropertyMock(side_effect=ConnectionError("rate limited"))
+        type(self.w3.eth).gas_price = self.gas_price
+        # Fantom has no Alchemy endpoint, so only the configured RPC is used
+        self.brain.web3_connections[250] = self.w3
+
+    def test_backoff_doubles_and_caps(self):
+        """Each consecutive failure doubles the wait, up to the cap"""
+        key = ('rpc', 250)
+        for expected in (1, 2, 4, 8, 16, 32, 60, 60):
+            self.brain._record_endpoint_failure(key, self.now)
+            self.assertEqual(self.brain._endpoint_backoff[key][1], self.now + expected)
+
+    def test_failing_endpoint_skipped_while_backing_off(self):
+        """A failed RPC is not called again until its backoff expires"""
+        self.assertEqual(self.brain._fetch_gas_price(250), 0.0)
+        self.assertEqual(self.brain._fetch_gas_price(250), 0.0)
+        self.assertEqual(self.gas_price.call_count, 1)
+
+        self.now += 1.0
+        self.brain._fetch_gas_price(250)
+        self.assertEqual(self.gas_price.call_count, 2)
+
+    def test_success_clears_backoff(self):
+        """A successful fetch resets the endpoint's failure count"""
+        self.brain._fetch_gas_price(250)
+        self.now += 1.0
+        self.gas_price.side_effect = None
+        self.gas_price.return_value = 30_000_000_000
+
+        self.assertEqual(self.brain._fetch_gas_price(250), 30.0)
+        self.assertNotIn(('rpc', 250), self.brain._endpoint_backoff)
+
+    def test_gas_price_capped(self):
+        """Prices above the safety ceiling are clamped"""
+        self.gas_price.side_effect = None
+        self.gas_price.return_value = 500_000_000_000
+
+        self.assertEqual(self.brain._fetch_gas_price(250), 200.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
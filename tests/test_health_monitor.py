@@ -0,0 +1,90 @@
+"""
+Test Suite for the Mainnet Health Monitor - JSON-RPC probes
+
+Tests batch response matching and the per-call fallback with a fake session.
+"""
+
+import unittest
+from unittest import mock
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mainnet_health_monitor import MainnetHealthMonitor
+
+RPC_URL = "https://rpc.example"
+
+
+def fake_response(body):
+    resp = mock.Mock()
+    resp.json.return_value = body
+    resp.raise_for_status.return_value = None
+    return resp
+
+
+def make_monitor(*bodies):
+    """Monitor whose session answers each POST with the next body"""
+    monitor = MainnetHealthMonitor.__new__(MainnetHealthMonitor)
+    monitor._session = mock.Mock()
+    monitor._session.post.side_effect = [fake_response(body) for body in bodies]
+    return monitor
+
+
+class TestBatchRpc(unittest.TestCase):
+    """Test _batch_rpc response handling"""
+
+    calls = [("eth_blockNumber", []), ("eth_gasPrice", [])]
+
+    def test_results_matched_by_id(self):
+        """Out-of-order batch responses are returned in call order"""
+        monitor = make_monitor([
+            {"jsonrpc": "2.0", "id": 1, "result": "0x3b9aca00"},
+            {"jsonrpc": "2.0", "id": 0, "result": "0x10"},
+        ])
+
+        self.assertEqual(monitor._batch_rpc(RPC_URL, self.calls), [16, 1_000_000_000])
+        self.assertEqual(monitor._session.post.call_count, 1)
+
+    def test_error_item_raises_with_provider_error(self):
+        """A per-call error in the batch names the failing method"""
+        monitor = make_monitor([
+            {"jsonrpc": "2.0", "id": 0, "result": "0x10"},
+            {"jsonrpc": "2.0", "id": 1, "error": {"code": -32601, "message": "method not found"}},
+        ])
+
+        with self.assertRaisesRegex(RuntimeError, "eth_gasPrice failed: .*method not found"):
+            monitor._batch_rpc(RPC_URL, self.calls)
+
+    def test_missing_id_raises(self):
+        """A batch response missing one of the calls is an error"""
+        monitor = make_monitor([{"jsonrpc": "2.0", "id": 0, "result": "0x10"}])
+
+        with self.assertRaisesRegex(RuntimeError, "eth_gasPrice failed: missing response"):
+            monitor._batch_rpc(RPC_URL, self.calls)
+
+    def test_batch_rejected_falls_back_to_single_calls(self):
+        """A provider answering the batch with one error object gets one POST per call"""
+        monitor = make_monitor(
+            {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "batch not supported"}},
+            {"jsonrpc": "2.0", "id": 0, "result": "0x10"},
+            {"jsonrpc": "2.0", "id": 0, "result": "0x3b9aca00"},
+        )
+
+        self.assertEqual(monitor._batch_rpc(RPC_URL, self.calls), [16, 1_000_000_000])
+        self.assertEqual(monitor._session.post.call_count, 3)
+
+    def test_single_call_error_is_reported(self):
+        """When the fallback call fails too, the provider's error is surfaced"""
+        monitor = make_monitor(
+            {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "batch not supported"}},
+            {"jsonrpc": "2.0", "id": 0, "error": {"code": -32005, "message": "rate limited"}},
+        )
+
+        with self.assertRaisesRegex(RuntimeError, "eth_blockNumber failed: .*rate limited"):
+            monitor._batch_rpc(RPC_URL, self.calls)
+
+
+if __name__ == '__main__':
+    unittest.main()
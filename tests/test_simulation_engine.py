@@ -0,0 +1,359 @@
+"""
+Test Suite for the Titan Simulation Engine
+
+Covers the per-chain engine cache, RPC failover and the TVL read path
+without a live RPC.
+"""
+
+import unittest
+from unittest import mock
+import json
+import sys
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import requests
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core.titan_simulation_engine as engine_mod
+from core.config import CHAINS
+
+USDC_POLYGON = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"
+
+
+class FakeClock:
+    """Controllable stand-in for time.monotonic"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class LocalRpcServer:
+    """
+    JSON-RPC endpoint on a real local socket.
+    
+    Each reply is "ok", "hang" (hold the request open) or an HTTP status
+    code; the last one repeats. `hits` counts requests received.
+    """
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.hits = 0
+        self.release = threading.Event()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                reply = server.replies[min(server.hits, len(server.replies) - 1)]
+                server.hits += 1
+                if reply == "hang":
+                    server.release.wait(5)
+                    return
+                if reply == "ok":
+                    status, payload = 200, {"jsonrpc": "2.0", "id": body["id"], "result": "0x01"}
+                else:
+                    status, payload = reply, {"error": "unavailable"}
+                data = json.dumps(payload).encode()
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                except OSError:
+                    pass
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._httpd.server_port}"
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.release.set()
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+class FlakyEngine:
+    """Stand-in engine whose first connect fails and later ones succeed."""
+    builds = 0
+
+    def __init__(self, chain_id):
+        FlakyEngine.builds += 1
+        self.chain_id = chain_id
+        self.w3 = None if FlakyEngine.builds == 1 else object()
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+    def get_lender_tvl(self, token_address, protocol="BALANCER"):
+        return 0 if self.w3 is None else 10**24
+
+
+class TestEngineCache(unittest.TestCase):
+    """Test that failed connections are not cached"""
+
+    def setUp(self):
+        FlakyEngine.builds = 0
+        engine_mod.reset_engines()
+        patcher = mock.patch.object(engine_mod, "TitanSimulationEngine", FlakyEngine)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(engine_mod.reset_engines)
+
+    def test_rpc_recovery_reconnects(self):
+        """A chain whose RPC was down gets a connected engine once it recovers"""
+        self.assertIsNone(engine_mod._get_engine(137).w3)
+
+        recovered = engine_mod._get_engine(137)
+        self.assertIsNotNone(recovered.w3)
+        self.assertEqual(FlakyEngine.builds, 2)
+
+    def test_connected_engine_is_reused(self):
+        """Once connected, the same engine serves every later call"""
+        engine_mod._get_engine(137)
+        connected = engine_mod._get_engine(137)
+
+        self.assertIs(engine_mod._get_engine(137), connected)
+        self.assertEqual(FlakyEngine.builds, 2)
+
+    def test_provider_tvl_recovers(self):
+        """TVL reads return real liquidity again after an RPC outage"""
+        self.assertEqual(engine_mod.get_provider_tvl("0x" + "11" * 20), 0)
+        self.assertEqual(engine_mod.get_provider_tvl("0x" + "11" * 20), 10**24)
+
+    def test_reset_engines_forces_rebuild(self):
+        """reset_engines drops connected engines"""
+        engine_mod._get_engine(137)
+        engine_mod._get_engine(137)
+        engine_mod.reset_engines()
+        engine_mod._get_engine(137)
+
+        self.assertEqual(FlakyEngine.builds, 3)
+
+
+
+class TestFailoverHTTPProvider(unittest.TestCase):
+    """Test endpoint ordering, failover and cooldown"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.object(engine_mod.time, "monotonic", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.provider = engine_mod.FailoverHTTPProvider(["https://a.example", "https://b.example"])
+        self.a, self.b = mock.Mock(), mock.Mock()
+        self.provider._providers = [self.a, self.b]
+        self.a.make_request.return_value = {"result": "0xa"}
+        self.b.make_request.return_value = {"result": "0xb"}
+
+    def test_fastest_endpoint_first(self):
+        """Requests go to the endpoint with the lowest latency average"""
+        self.provider._latency = [0.5, 0.1]
+
+        self.assertEqual(self.provider.make_request("eth_blockNumber", []), {"result": "0xb"})
+        self.a.make_request.assert_not_called()
+
+    def test_transport_error_fails_over(self):
+        """A timeout on one endpoint retries the request on the next"""
+        self.a.make_request.side_effect = requests.Timeout("slow")
+
+        self.assertEqual(self.provider.make_request("eth_call", []), {"result": "0xb"})
+        self.assertEqual(self.provider._cooldown_until[0], 1000.0 + engine_mod.RPC_COOLDOWN_SECONDS)
+
+    def test_cooling_endpoint_skipped_until_cooldown_ends(self):
+        """A failed endpoint is not retried until its cooldown expires"""
+        self.a.make_request.side_effect = requests.ConnectionError("down")
+        self.provider.make_request("eth_call", [])
+        self.a.make_request.reset_mock()
+
+        self.provider.make_request("eth_call", [])
+        self.a.make_request.assert_not_called()
+
+        self.clock.now += engine_mod.RPC_COOLDOWN_SECONDS
+        self.a.make_request.side_effect = None
+        self.a.make_request.return_value = {"result": "0xa"}
+        self.provider._latency = [0.0, 1.0]
+        self.assertEqual(self.provider.make_request("eth_call", []), {"result": "0xa"})
+
+    def test_all_failing_raises_last_error(self):
+        """When every endpoint fails the last transport error is raised"""
+        self.a.make_request.side_effect = requests.ConnectionError("a down")
+        self.b.make_request.side_effect = requests.ConnectionError("b down")
+
+        with self.assertRaises(requests.ConnectionError):
+            self.provider.make_request("eth_call", [])
+
+    def test_all_cooling_still_tries(self):
+        """With every endpoint cooling down, requests are still attempted"""
+        self.provider._cooldown_until = [2000.0, 2000.0]
+
+        self.assertIn(self.provider.make_request("eth_call", []), ({"result": "0xa"}, {"result": "0xb"}))
+
+
+class TestFailoverOverHttp(unittest.TestCase):
+    """Test failover through the real HTTP stack against local servers"""
+
+    TIMEOUT = 0.3
+
+    def setUp(self):
+        patcher = mock.patch.object(engine_mod, "RPC_TIMEOUT_SECONDS", self.TIMEOUT)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def serve(self, *replies):
+        server = LocalRpcServer(*replies)
+        self.addCleanup(server.stop)
+        return server
+
+    def build(self, *servers):
+        provider, session = engine_mod._build_provider([server.url for server in servers])
+        self.addCleanup(session.close)
+        return provider
+
+    def test_timeout_fails_over_after_one_attempt(self):
+        """A hung endpoint is tried once, then the request moves on"""
+        hung, healthy = self.serve("hang"), self.serve("ok")
+        provider = self.build(hung, healthy)
+
+        start = time.monotonic()
+        response = provider.make_request("eth_call", [{"to": USDC_POLYGON, "data": "0x"}, "latest"])
+
+        self.assertEqual(response["result"], "0x01")
+        self.assertEqual((hung.hits, healthy.hits), (1, 1))
+        self.assertLess(time.monotonic() - start, 2 * self.TIMEOUT)
+
+    def test_rate_limited_endpoint_not_retried(self):
+        """A 429 fails over immediately instead of hitting the same endpoint again"""
+        throttled, healthy = self.serve(429), self.serve("ok")
+        provider = self.build(throttled, healthy)
+
+        self.assertEqual(provider.make_request("eth_blockNumber", [])["result"], "0x01")
+        self.assertEqual((throttled.hits, healthy.hits), (1, 1))
+
+    def test_failed_endpoint_cools_down(self):
+        """Later requests skip an endpoint that just returned a 5xx"""
+        failing, healthy = self.serve(503), self.serve("ok")
+        provider = self.build(failing, healthy)
+
+        for _ in range(3):
+            provider.make_request("eth_blockNumber", [])
+
+        self.assertEqual((failing.hits, healthy.hits), (1, 3))
+
+    def test_single_endpoint_retries_gateway_errors(self):
+        """With no other endpoint, a 503 is retried in place"""
+        server = self.serve(503, "ok")
+        provider = self.build(server)
+
+        self.assertEqual(provider.make_request("eth_blockNumber", [])["result"], "0x01")
+        self.assertEqual(server.hits, 2)
+
+    def test_single_endpoint_timeout_not_retried(self):
+        """A read timeout on the only endpoint fails after one attempt"""
+        server = self.serve("hang")
+        provider = self.build(server)
+
+        start = time.monotonic()
+        with self.assertRaises(requests.RequestException):
+            provider.make_request("eth_blockNumber", [])
+
+        self.assertEqual(server.hits, 1)
+        self.assertLess(time.monotonic() - start, 2 * self.TIMEOUT)
+
+
+class TestTvlCache(unittest.TestCase):
+    """Test TTL caching of lender balances"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.object(engine_mod.time, "monotonic", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        engine_mod.invalidate_tvl_cache()
+        engine_mod.reset_metrics()
+        self.addCleanup(engine_mod.invalidate_tvl_cache)
+
+        self.engine = engine_mod.TitanSimulationEngine.__new__(engine_mod.TitanSimulationEngine)
+        self.engine.chain_id = 137
+        self.engine.chain_config = CHAINS[137]
+        self.engine.w3 = mock.Mock()
+        self.raw_call = mock.Mock()
+        self.engine._raw_eth_call = self.raw_call
+
+    def balance(self, amount):
+        return amount.to_bytes(32, "big")
+
+    def test_balance_cached_within_ttl(self):
+        """A balance read is reused until the TTL runs out"""
+        self.raw_call.return_value = self.balance(5_000_000)
+
+        self.assertEqual(self.engine.get_lender_tvl(USDC_POLYGON), 5_000_000)
+        self.clock.now += engine_mod._TVL_TTL - 1
+        self.assertEqual(self.engine.get_lender_tvl(USDC_POLYGON), 5_000_000)
+        self.assertEqual(self.raw_call.call_count, 1)
+        self.assertEqual(engine_mod.METRICS["tvl_cache_hits"], 1)
+
+    def test_balance_refetched_after_ttl(self):
+        """An expired balance triggers a fresh read"""
+        self.raw_call.return_value = self.balance(5_000_000)
+        self.engine.get_lender_tvl(USDC_POLYGON)
+
+        self.clock.now += engine_mod._TVL_TTL + 1
+        self.raw_call.return_value = self.balance(7_000_000)
+        self.assertEqual(self.engine.get_lender_tvl(USDC_POLYGON), 7_000_000)
+        self.assertEqual(self.raw_call.call_count, 2)
+
+    def test_zero_balance_cached_longer(self):
+        """An empty vault is remembered for the longer empty-balance TTL"""
+        self.raw_call.return_value = self.balance(0)
+        self.engine.get_lender_tvl(USDC_POLYGON)
+
+        self.clock.now += engine_mod._TVL_TTL + 1
+        self.assertEqual(self.engine.get_lender_tvl(USDC_POLYGON), 0)
+        self.assertEqual(self.raw_call.call_count, 1)
+
+        self.clock.now += engine_mod._EMPTY_TVL_TTL
+        self.engine.get_lender_tvl(USDC_POLYGON)
+        self.assertEqual(self.raw_call.call_count, 2)
+
+    def test_empty_return_not_cached(self):
+        """No code at the token address reads as 0 but is not cached"""
+        self.raw_call.return_value = b""
+
+        self.assertEqual(self.engine.get_lender_tvl(USDC_POLYGON), 0)
+        self.assertEqual(self.engine.get_lender_tvl(USDC_POLYGON), 0)
+        self.assertEqual(self.raw_call.call_count, 2)
+
+    def test_rpc_error_not_cached(self):
+        """A failed read returns 0 and the next call retries"""
+        self.raw_call.side_effect = ValueError("execution reverted")
+
+        self.assertEqual(self.engine.get_lender_tvl(USDC_POLYGON), 0)
+        self.raw_call.side_effect = None
+        self.raw_call.return_value = self.balance(9)
+        self.assertEqual(self.engine.get_lender_tvl(USDC_POLYGON), 9)
+
+    def test_invalidate_drops_chain_entries(self):
+        """invalidate_tvl_cache forces the next read for that chain"""
+        self.raw_call.return_value = self.balance(5)
+        self.engine.get_lender_tvl(USDC_POLYGON)
+
+        engine_mod.invalidate_tvl_cache(137)
+        self.engine.get_lender_tvl(USDC_POLYGON)
+        self.assertEqual(self.raw_call.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
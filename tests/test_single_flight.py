@@ -0,0 +1,85 @@
+"""
+Test Suite for single-flight request coalescing
+"""
+
+import unittest
+import threading
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import single_flight as sf
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Test that concurrent identical reads share one call"""
+
+    def test_concurrent_callers_share_one_fetch(self):
+        """Callers arriving while a fetch is in flight get its result"""
+        entered = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            entered.set()
+            release.wait(5)
+            return 42
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            leader = pool.submit(sf.single_flight, ("tvl", 1), fetch)
+            self.assertTrue(entered.wait(5))
+
+            # Count followers as they start waiting on the leader's future
+            future = sf._inflight[("tvl", 1)]
+            waiting = threading.Semaphore(0)
+            wait_for_result = future.result
+
+            def result(timeout=None):
+                waiting.release()
+                return wait_for_result(timeout)
+
+            future.result = result
+            followers = [pool.submit(sf.single_flight, ("tvl", 1), fetch) for _ in range(3)]
+            for _ in followers:
+                self.assertTrue(waiting.acquire(timeout=5))
+            self.assertFalse(any(f.done() for f in followers))
+
+            release.set()
+            results = [leader.result(5)] + [f.result(5) for f in followers]
+
+        self.assertEqual(results, [42] * 4)
+        self.assertEqual(len(calls), 1)
+
+    def test_sequential_calls_fetch_again(self):
+        """Nothing is cached once the in-flight call has finished"""
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return len(calls)
+
+        self.assertEqual(sf.single_flight(("tvl", 2), fetch), 1)
+        self.assertEqual(sf.single_flight(("tvl", 2), fetch), 2)
+        self.assertNotIn(("tvl", 2), sf._inflight)
+
+    def test_distinct_keys_do_not_coalesce(self):
+        """Different keys run their own fetch"""
+        self.assertEqual(sf.single_flight(("univ3", 1), lambda: "a"), "a")
+        self.assertEqual(sf.single_flight(("univ3", 2), lambda: "b"), "b")
+
+    def test_exception_propagates_and_clears_key(self):
+        """A failing fetch raises to the caller and does not stay in flight"""
+        def fetch():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            sf.single_flight(("tvl", 3), fetch)
+        self.assertNotIn(("tvl", 3), sf._inflight)
+
+
+if __name__ == '__main__':
+    unittest.main()